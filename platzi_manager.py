@@ -15,12 +15,111 @@ Compatible con el sistema de trazabilidad v2.0
 
 import argparse
 import json
+import mmap
+import os
+import re
 import shutil
 import sys
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+
+def _loads(raw) -> Dict:
+    """Parse checkpoint bytes (or a buffer over them)."""
+    return json.loads(bytes(raw))
+
+
+def _read_checkpoint(path: Path) -> Dict:
+    """Parse the checkpoint through a read-only memory map instead of a heap copy."""
+    with open(path, 'rb') as f:
+        # mmap refuses zero-length files; let the parser report the empty document
+        if os.fstat(f.fileno()).st_size == 0:
+            return _loads(b'')
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return _loads(view)
+
+
+# Full-width separator used by the reports
+_RULE = "=" * 100
+
+# Characters that cannot appear in file names, removed by _clean_string
+_INVALID_FILENAME_CHARS = str.maketrans('', '', '<>:"/\\|?*')
+
+# Title normalization used to match course titles against directory names
+_TITLE_PUNCT = str.maketrans('', '', ':.,¿?')
+_WS_RE = re.compile(r'\s+')
+_NUM_PREFIX_RE = re.compile(r'^\d+\.\s*')  # "1. Curso..." -> "Curso..."
+
+# Status values written by the downloader's ProgressTracker. Interned explicitly so
+# every table and comparison below shares one object per status.
+STATUS_COMPLETED = sys.intern("completed")
+STATUS_FAILED = sys.intern("failed")
+STATUS_IN_PROGRESS = sys.intern("in_progress")
+STATUS_PENDING = sys.intern("pending")
+
+# Status -> key of the matching counter in get_statistics()
+_COURSE_STAT_KEYS = {
+    STATUS_COMPLETED: "completed_courses",
+    STATUS_FAILED: "failed_courses",
+    STATUS_IN_PROGRESS: "in_progress_courses",
+}
+_UNIT_STAT_KEYS = {
+    STATUS_COMPLETED: "completed_units",
+    STATUS_FAILED: "failed_units",
+    STATUS_IN_PROGRESS: "in_progress_units",
+    STATUS_PENDING: "pending_units",
+}
+
+# Course status -> icon shown by list_courses; anything else is shown as paused
+_STATUS_ICONS = {STATUS_COMPLETED: "✅", STATUS_FAILED: "❌", STATUS_IN_PROGRESS: "🔄"}
+
+
+@lru_cache(maxsize=128)
+def _format_iso_timestamp(timestamp_str: str) -> str:
+    """Render an ISO timestamp as 'YYYY-MM-DD HH:MM:SS', leaving malformed ones untouched."""
+    try:
+        return datetime.fromisoformat(timestamp_str).strftime("%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        return timestamp_str
+
+
+@lru_cache(maxsize=4096)
+def _dir_is_empty(path: str) -> bool:
+    """Whether a directory has no entries; stops at the first one instead of listing it all.
+
+    Memoized because clean_tracking probes the same course directories repeatedly and
+    never changes the Courses/ tree.
+    """
+    with os.scandir(path) as entries:
+        return next(entries, None) is None
+
+
+def _normalize_title(text: str) -> str:
+    """Normalize a title for comparison: remove punctuation, extra spaces, lowercase."""
+    # Remove common punctuation, then collapse runs of whitespace into a single space
+    text = _WS_RE.sub(' ', text.translate(_TITLE_PUNCT))
+    return text.lower().strip()
+
+
+def _remove_course_prefix(text: str) -> str:
+    """Drop a leading "curso de "/"audiocurso " style prefix from a normalized title."""
+    prefixes = ['curso de ', 'curso ', 'audiocurso de ', 'audiocurso ']
+    for prefix in prefixes:
+        if text.startswith(prefix):
+            return text[len(prefix):]
+    return text
+
+
+def _dumps(data: Dict, compact: bool = False) -> bytes:
+    """Serialize checkpoint data to UTF-8 JSON bytes, indented unless compact is requested."""
+    if compact:
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
 # ANSI colors for better readability
 class Colors:
     HEADER = '\033[95m'
@@ -36,9 +135,13 @@ class Colors:
 class ProgressManager:
     """Manages download progress tracking."""
     
-    def __init__(self, checkpoint_file: str = "download_progress.json"):
+    def __init__(self, checkpoint_file: str = "download_progress.json", compact: bool = False):
         self.checkpoint_file = Path(checkpoint_file)
+        self.compact = compact  # save without indentation (smaller and faster to write, hard to edit by hand)
         self.data = None
+        self._course_dirs = None  # (dir, normalized, core, no prefix) per course dir, built on demand
+        self._course_unit_counters = None  # course id -> Counter of unit statuses, built on demand
+        self._backup_done = False
         self._load()
     
     def _load(self):
@@ -49,8 +152,8 @@ class ProgressManager:
             return False
         
         try:
-            with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
-                self.data = json.load(f)
+            self.data = _read_checkpoint(self.checkpoint_file)
+            self._course_unit_counters = None
             return True
         except Exception as e:
             print(f"❌ Error loading checkpoint: {e}")
@@ -60,155 +163,164 @@ class ProgressManager:
         """Save checkpoint file."""
         try:
             self.data["last_updated"] = datetime.now().isoformat()
-            with open(self.checkpoint_file, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, indent=2, ensure_ascii=False)
+            # Write a sibling temp file and swap it in, so an interrupted save
+            # never leaves a truncated checkpoint behind
+            tmp_path = self.checkpoint_file.with_suffix('.json.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(_dumps(self.data, compact=self.compact))
+                f.flush()
+                os.fsync(f.fileno())  # make sure the bytes are on disk before the swap
+            os.replace(tmp_path, self.checkpoint_file)
             return True
         except Exception as e:
             print(f"❌ Error saving checkpoint: {e}")
             return False
     
     def _backup(self):
-        """Create backup before modifying."""
+        """Create backup before modifying (once per manager, so it keeps the original state)."""
+        if self._backup_done:
+            return True
         backup_path = self.checkpoint_file.with_suffix('.json.backup')
         try:
             shutil.copy2(self.checkpoint_file, backup_path)
+            self._backup_done = True
             print(f"💾 Backup created: {backup_path}")
             return True
         except Exception as e:
             print(f"⚠️  Could not create backup: {e}")
             return False
     
+    def _unit_counters(self) -> Dict[str, Counter]:
+        """Unit status counts per course, computed once until the courses change."""
+        if self._course_unit_counters is None:
+            self._course_unit_counters = {
+                course_id: Counter(u.get("status", "") for u in course_data.get("units", {}).values())
+                for course_id, course_data in self.data.get("courses", {}).items()
+            }
+        return self._course_unit_counters
+
     def get_statistics(self) -> Dict:
         """Get current statistics."""
         if not self.data:
             return {}
         
-        stats = {
-            'total_courses': len(self.data.get("courses", {})),
-            'completed_courses': 0,
-            'failed_courses': 0,
-            'in_progress_courses': 0,
-            'total_units': 0,
-            'completed_units': 0,
-            'failed_units': 0,
-            'in_progress_units': 0,
-            'pending_units': 0,
-        }
-        
-        for course_data in self.data.get("courses", {}).values():
-            status = course_data.get("status", "")
-            if status == "completed":
-                stats['completed_courses'] += 1
-            elif status == "failed":
-                stats['failed_courses'] += 1
-            elif status == "in_progress":
-                stats['in_progress_courses'] += 1
-            
-            for unit_data in course_data.get("units", {}).values():
-                stats['total_units'] += 1
-                unit_status = unit_data.get("status", "")
-                if unit_status == "completed":
-                    stats['completed_units'] += 1
-                elif unit_status == "failed":
-                    stats['failed_units'] += 1
-                elif unit_status == "in_progress":
-                    stats['in_progress_units'] += 1
-                elif unit_status == "pending":
-                    stats['pending_units'] += 1
+        courses = self.data.get("courses", {})
+        course_counts = Counter(c.get("status", "") for c in courses.values())
+        unit_counts = Counter()
+        for counts in self._unit_counters().values():
+            unit_counts.update(counts)
+        
+        stats = {'total_courses': len(courses)}
+        stats.update((key, course_counts[status]) for status, key in _COURSE_STAT_KEYS.items())
+        stats['total_units'] = sum(unit_counts.values())
+        stats.update((key, unit_counts[status]) for status, key in _UNIT_STAT_KEYS.items())
         
         return stats
+
+    def _courses_with_pending(self) -> List[Tuple[str, int]]:
+        """(title, units not yet completed) for every course with pending work."""
+        unit_counters = self._unit_counters()
+        courses_with_pending = []
+        for course_id, course_data in self.data.get("courses", {}).items():
+            counts = unit_counters[course_id]
+            course_pending = counts[STATUS_FAILED] + counts[STATUS_IN_PROGRESS] + counts[STATUS_PENDING]
+            if course_pending > 0:
+                courses_with_pending.append((course_data.get("title", "Unknown"), course_pending))
+        return courses_with_pending
     
     def show_status(self, verbose: bool = False):
         """Display detailed status."""
         if not self.data:
             return
         
-        print("\n" + "="*100)
-        print("📊 DOWNLOAD STATUS - Platzi Downloader")
-        print("="*100 + "\n")
+        # Collect the report and write it once instead of one console write per line
+        out: List[str] = []
+        add = out.append
+
+        add("\n" + _RULE)
+        add("📊 DOWNLOAD STATUS - Platzi Downloader")
+        add(_RULE + "\n")
         
         # Session info
-        print("📅 Session Info:")
-        print(f"   Started: {self._format_timestamp(self.data.get('started_at'))}")
-        print(f"   Last updated: {self._format_timestamp(self.data.get('last_updated'))}")
+        add("📅 Session Info:")
+        add(f"   Started: {self._format_timestamp(self.data.get('started_at'))}")
+        add(f"   Last updated: {self._format_timestamp(self.data.get('last_updated'))}")
         if "_metadata" in self.data:
-            print(f"   Tracker version: {self.data['_metadata'].get('version', '1.0')}")
+            add(f"   Tracker version: {self.data['_metadata'].get('version', '1.0')}")
             if self.data['_metadata'].get('last_validation'):
-                print(f"   Last validation: {self._format_timestamp(self.data['_metadata']['last_validation'])}")
-        print()
+                add(f"   Last validation: {self._format_timestamp(self.data['_metadata']['last_validation'])}")
+        add("")
         
         # Statistics
         stats = self.get_statistics()
-        print("📈 Statistics:")
-        print(f"   📚 Courses: {stats['completed_courses']}/{stats['total_courses']} completed")
+        add("📈 Statistics:")
+        add(f"   📚 Courses: {stats['completed_courses']}/{stats['total_courses']} completed")
         if stats['failed_courses'] > 0:
-            print(f"      ❌ Failed: {stats['failed_courses']}")
+            add(f"      ❌ Failed: {stats['failed_courses']}")
         if stats['in_progress_courses'] > 0:
-            print(f"      🔄 In progress: {stats['in_progress_courses']}")
+            add(f"      🔄 In progress: {stats['in_progress_courses']}")
         
-        print(f"   📝 Units: {stats['completed_units']}/{stats['total_units']} completed")
+        add(f"   📝 Units: {stats['completed_units']}/{stats['total_units']} completed")
         if stats['failed_units'] > 0:
-            print(f"      ❌ Failed: {stats['failed_units']}")
+            add(f"      ❌ Failed: {stats['failed_units']}")
         if stats['in_progress_units'] > 0:
-            print(f"      🔄 In progress: {stats['in_progress_units']}")
+            add(f"      🔄 In progress: {stats['in_progress_units']}")
         if stats['pending_units'] > 0:
-            print(f"      ⏸️  Pending: {stats['pending_units']}")
-        print()
+            add(f"      ⏸️  Pending: {stats['pending_units']}")
+        add("")
         
         # Learning paths
         if self.data.get("learning_paths"):
-            print("🗂️  Learning Paths:")
+            add("🗂️  Learning Paths:")
             for path_data in self.data["learning_paths"].values():
-                status_icon = "✅" if path_data["status"] == "completed" else "🔄"
-                print(f"   {status_icon} {path_data['title']}: {path_data['completed_courses']}/{path_data['total_courses']} courses")
-            print()
+                status_icon = "✅" if path_data["status"] == STATUS_COMPLETED else "🔄"
+                add(f"   {status_icon} {path_data['title']}: {path_data['completed_courses']}/{path_data['total_courses']} courses")
+            add("")
         
-        # Courses with pending units
-        courses_with_pending = []
-        for course_id, course_data in self.data.get("courses", {}).items():
-            pending_count = sum(1 for u in course_data.get("units", {}).values() 
-                              if u.get("status") in ["pending", "failed", "in_progress"])
-            if pending_count > 0:
-                courses_with_pending.append((course_data.get("title", "Unknown"), pending_count))
+        # Courses with pending units (reuses the unit counts get_statistics built)
+        courses_with_pending = self._courses_with_pending()
         
         if courses_with_pending:
-            print(f"⏳ Courses with Pending Work ({len(courses_with_pending)}):")
-            for title, count in courses_with_pending[:10]:
-                print(f"   • {title}: {count} units pending")
-            if len(courses_with_pending) > 10:
-                print(f"   ... and {len(courses_with_pending) - 10} more")
-            print()
+            pending_total = len(courses_with_pending)
+            add(f"⏳ Courses with Pending Work ({pending_total}):")
+            for title, count in islice(courses_with_pending, 10):
+                add(f"   • {title}: {count} units pending")
+            if pending_total > 10:
+                add(f"   ... and {pending_total - 10} more")
+            add("")
         
         # Recent errors
         errors = self.data.get("errors", [])
         if errors:
-            print(f"❌ Recent Errors ({len(errors)} total, showing last 5):")
-            for error in errors[-5:]:
-                print(f"   • [{error.get('type', 'unknown').upper()}] {error.get('title', 'Unknown')}")
-                print(f"     {error.get('error', 'No description')[:80]}...")
-            print()
+            error_count = len(errors)
+            add(f"❌ Recent Errors ({error_count} total, showing last 5):")
+            # Index the tail directly; islice would step through every older error first
+            for i in range(max(0, error_count - 5), error_count):
+                error = errors[i]
+                add(f"   • [{error.get('type', 'unknown').upper()}] {error.get('title', 'Unknown')}")
+                add(f"     {error.get('error', 'No description')[:80]}...")
+            add("")
         
-        print("="*100)
+        add(_RULE)
         
         # Recommendations
-        print("\n💡 Recommendations:")
+        add("\n💡 Recommendations:")
         if stats['failed_units'] > 0 or stats['failed_courses'] > 0:
-            print("   • Run with --retry-failed to retry failed downloads")
+            add("   • Run with --retry-failed to retry failed downloads")
         if courses_with_pending:
-            print("   • Run 'platzi download <URL>' to continue incomplete courses")
+            add("   • Run 'platzi download <URL>' to continue incomplete courses")
         if stats['completed_courses'] == stats['total_courses'] and stats['total_courses'] > 0:
-            print("   • ✅ All downloads complete!")
-        print()
+            add("   • ✅ All downloads complete!")
+        add("")
+        sys.stdout.write("\n".join(out) + "\n")
     
     def _format_timestamp(self, timestamp_str):
         """Format ISO timestamp to readable format."""
         if not timestamp_str:
             return "N/A"
-        try:
-            dt = datetime.fromisoformat(timestamp_str)
-            return dt.strftime("%Y-%m-%d %H:%M:%S")
-        except:
+        if not isinstance(timestamp_str, str):
             return timestamp_str
+        return _format_iso_timestamp(timestamp_str)
     
     def retry_failed(self, course_id: str = None, dry_run: bool = False) -> int:
         """Mark failed units as pending for retry."""
@@ -216,24 +328,35 @@ class ProgressManager:
             return 0
         
         retried_count = 0
+        lines: List[str] = []  # per-unit dry-run lines, written in one go
         
         if not dry_run:
             self._backup()
         
+        unit_counters = self._unit_counters()
         for cid, course_data in self.data.get("courses", {}).items():
             if course_id and cid != course_id:
                 continue
             
-            for unit_id, unit_data in course_data.get("units", {}).items():
-                if unit_data.get("status") == "failed":
+            # Courses without failed units have nothing to retry; skip their unit scan
+            if not unit_counters[cid][STATUS_FAILED]:
+                continue
+
+            course_title = course_data.get('title')
+            for unit_data in course_data.get("units", {}).values():
+                if unit_data.get("status") == STATUS_FAILED:
                     if dry_run:
-                        print(f"   Would retry: {course_data.get('title')} / {unit_data.get('title')}")
+                        lines.append(f"   Would retry: {course_title} / {unit_data.get('title')}\n")
                     else:
-                        unit_data["status"] = "pending"
+                        unit_data["status"] = STATUS_PENDING
                         unit_data["error"] = None
                     retried_count += 1
         
+        if lines:
+            sys.stdout.write("".join(lines))
+
         if retried_count > 0 and not dry_run:
+            self._course_unit_counters = None
             self._save()
             print(f"✅ Marked {retried_count} failed units as pending for retry")
         elif retried_count == 0:
@@ -251,22 +374,31 @@ class ProgressManager:
         
         courses_reset = 0
         course_pattern_lower = course_pattern.lower()
+        courses = self.data.get("courses", {})
+        reset_ids = set()
+        lines: List[str] = []
         
-        for course_id, course_data in list(self.data.get("courses", {}).items()):
+        for course_id, course_data in courses.items():
             course_title = course_data.get("title", "").lower()
             
             if course_pattern_lower in course_title or course_pattern_lower in course_id.lower():
                 if dry_run:
-                    print(f"   Would reset: {course_data.get('title')}")
+                    lines.append(f"   Would reset: {course_data.get('title')}\n")
                 else:
-                    del self.data["courses"][course_id]
-                    print(f"🔄 Reset: {course_data.get('title')}")
+                    reset_ids.add(course_id)
+                    lines.append(f"🔄 Reset: {course_data.get('title')}\n")
                 courses_reset += 1
+
+        if lines:
+            sys.stdout.write("".join(lines))
         
         if courses_reset > 0:
             if dry_run:
                 print(f"\n[DRY-RUN] Would reset {courses_reset} course(s)")
             else:
+                # Rebuild once instead of deleting while walking a copy of the items
+                self.data["courses"] = {cid: c for cid, c in courses.items() if cid not in reset_ids}
+                self._course_unit_counters = None
                 self._save()
                 print(f"\n✅ Reset {courses_reset} course(s). Run 'platzi download <URL>' to re-download")
         else:
@@ -290,63 +422,67 @@ class ProgressManager:
         courses_removed = 0
         units_removed = 0
         empty_dirs = 0
+        empty_course_dirs = None  # listed once, the first time a course directory is missing
         
         print("\n🔍 Checking for missing files...")
         
-        for course_id, course_data in list(self.data.get("courses", {}).items()):
+        courses = self.data.get("courses", {})
+        removed_ids = set()  # dropped in one rebuild after the scan
+        lines: List[str] = []  # per-course/unit report lines, written once after the scan
+
+        # Only check completed courses
+        to_check = [(cid, c) for cid, c in courses.items() if c.get("status") == STATUS_COMPLETED]
+
+        # Resolve the course directories up front. Each lookup is one stat of the direct path
+        # plus a scan of the in-memory directory index, which is listed once and shared
+        course_dirs = [self._find_course_directory(courses_base, c.get("title", "Unknown")) for _, c in to_check]
+
+        for (course_id, course_data), course_dir in zip(to_check, course_dirs):
             course_title = course_data.get("title", "Unknown")
             
-            # Only check completed courses
-            if course_data.get("status") != "completed":
-                continue
-            
-            # Try to find course directory
-            course_dir = self._find_course_directory(courses_base, course_title)
-            
             if not course_dir:
-                # Check if it's an empty directory
+                # Check if it's an empty directory in one of the learning paths
                 clean_title = self._clean_string(course_title, max_length=80)
-                direct_path = courses_base / clean_title
+                if empty_course_dirs is None:
+                    empty_course_dirs = self._list_empty_course_dirs(courses_base)
                 
-                # Also check in learning paths for empty dirs
-                found_empty = False
-                for learning_path in courses_base.iterdir():
-                    if not learning_path.is_dir():
-                        continue
-                    for course_dir_check in learning_path.iterdir():
-                        if course_dir_check.is_dir() and clean_title in course_dir_check.name:
-                            if not any(course_dir_check.iterdir()):
-                                found_empty = True
-                                empty_dirs += 1
-                                print(f"  📁 Empty directory (no files): {course_title}")
-                                break
-                    if found_empty:
-                        break
-                
-                if not found_empty:
-                    print(f"  ❌ Missing directory: {course_title}")
+                if any(clean_title in name for name in empty_course_dirs):
+                    empty_dirs += 1
+                    lines.append(f"  📁 Empty directory (no files): {course_title}\n")
+                else:
+                    lines.append(f"  ❌ Missing directory: {course_title}\n")
                 
-                if not dry_run:
-                    del self.data["courses"][course_id]
+                removed_ids.add(course_id)
                 courses_removed += 1
                 continue
             
             # Check units
             units = course_data.get("units", {})
-            for unit_id, unit_data in list(units.items()):
-                if unit_data.get("status") != "completed":
+            missing_units = []
+            # Simplified check: just verify course dir exists (stat it once, not per unit)
+            # Actual file checking is complex due to naming variations
+            course_dir_exists = course_dir.exists()
+            for unit_id, unit_data in units.items():
+                if unit_data.get("status") != STATUS_COMPLETED:
                     continue
                 
                 unit_title = unit_data.get("title", "Unknown")
-                # Simplified check: just verify course dir exists
-                # Actual file checking is complex due to naming variations
-                if not course_dir.exists():
-                    print(f"    ❌ Missing unit: {unit_title}")
-                    if not dry_run:
-                        del course_data["units"][unit_id]
+                if not course_dir_exists:
+                    lines.append(f"    ❌ Missing unit: {unit_title}\n")
+                    missing_units.append(unit_id)
                     units_removed += 1
+
+            if missing_units and not dry_run:
+                for unit_id in missing_units:
+                    units.pop(unit_id, None)
+
+        if lines:
+            sys.stdout.write("".join(lines))
         
         if not dry_run and (courses_removed > 0 or units_removed > 0):
+            if removed_ids:
+                self.data["courses"] = {cid: c for cid, c in courses.items() if cid not in removed_ids}
+            self._course_unit_counters = None
             self._save()
         
         if empty_dirs > 0:
@@ -355,138 +491,157 @@ class ProgressManager:
         
         return courses_removed, units_removed
     
+    def _list_empty_course_dirs(self, courses_base: Path) -> List[str]:
+        """Names of course directories inside learning paths that contain no files."""
+        empty = []
+        with os.scandir(courses_base) as learning_paths:
+            for learning_path in learning_paths:
+                if not learning_path.is_dir():
+                    continue
+                with os.scandir(learning_path.path) as course_dirs:
+                    for course_dir in course_dirs:
+                        if not course_dir.is_dir():
+                            continue
+                        if _dir_is_empty(course_dir.path):
+                            empty.append(course_dir.name)
+        return empty
+
+    def _course_dir_index(self, courses_base: Path) -> List[Tuple]:
+        """Non-empty course directories inside learning paths, with their precomputed match keys.
+
+        Built with one walk of Courses/ and reused for every course title. Each entry is
+        (path, normalized, len >= 40, len >= 50, core, core[:45] or None, no-prefix or None),
+        so _find_course_directory only has to compare strings.
+        """
+        if self._course_dirs is None:
+            self._course_dirs = []
+            # DirEntry.is_dir() answers from the readdir data instead of a stat per entry
+            with os.scandir(courses_base) as learning_paths:
+                learning_path_dirs = [entry.path for entry in learning_paths if entry.is_dir()]
+
+            for learning_path in learning_path_dirs:
+                with os.scandir(learning_path) as entries:
+                    course_entries = [entry for entry in entries if entry.is_dir()]
+
+                for course_entry in course_entries:
+                    # Check if directory has content
+                    try:
+                        if _dir_is_empty(course_entry.path):
+                            continue
+                    except OSError:
+                        continue
+
+                    # Remove numeric prefix if present (e.g., "1. Curso..." -> "Curso...")
+                    dir_name = _NUM_PREFIX_RE.sub('', course_entry.name)
+                    normalized = _normalize_title(dir_name)
+                    core = normalized[:50]
+                    no_prefix = _remove_course_prefix(normalized)
+                    self._course_dirs.append((
+                        Path(course_entry.path),
+                        normalized,
+                        len(normalized) >= 40,
+                        len(normalized) >= 50,
+                        core,
+                        core[:45] if len(core) >= 45 else None,
+                        no_prefix if len(no_prefix) > 15 else None,
+                    ))
+        return self._course_dirs
+
     def _find_course_directory(self, courses_base: Path, course_title: str) -> Path:
         """Try to find course directory with flexible matching."""
         # Clean title for comparison
         clean_title = self._clean_string(course_title, max_length=80)
         
-        # Normalize for comparison: remove punctuation, extra spaces, lowercase
-        def normalize(text):
-            import re
-            # Remove common punctuation
-            text = text.replace(':', '').replace('.', '').replace(',', '').replace('¿', '').replace('?', '')
-            # Replace multiple spaces with single space
-            text = re.sub(r'\s+', ' ', text)
-            # Lowercase and strip
-            return text.lower().strip()
-        
         # Get both full and truncated normalized versions
-        original_normalized = normalize(course_title)
-        clean_normalized = normalize(clean_title)
+        original_normalized = _normalize_title(course_title)
+        clean_normalized = _normalize_title(clean_title)
         
         # Also create a "core" version (first 50 chars of normalized)
         core_normalized = original_normalized[:50] if len(original_normalized) > 50 else original_normalized
         
+        # Prefix-stripped forms used by the last matching strategy
+        original_no_prefix = _remove_course_prefix(original_normalized)
+        clean_no_prefix = _remove_course_prefix(clean_normalized)
+
         # Try direct path (exact match)
         direct_path = courses_base / clean_title
-        if direct_path.exists() and direct_path.is_dir():
+        if direct_path.is_dir():
             # Check if directory has content
             try:
-                if any(direct_path.iterdir()):
+                if not _dir_is_empty(str(direct_path)):
                     return direct_path
-            except:
+            except OSError:
                 pass
         
+        # Length guards and prefixes of the title side, evaluated once instead of per directory
+        # Be more lenient with truncated names (at least 40 chars match)
+        min_match_len = 40
+        original_long = len(original_normalized) >= min_match_len
+        clean_long = len(clean_normalized) >= min_match_len
+        original_head = original_normalized[:30]
+        clean_head = clean_normalized[:30]
+        core_head = core_normalized[:45] if len(core_normalized) >= 45 else None
+        core_substring = len(core_normalized) > 30
+        # Only match prefix-stripped text if it is substantial (>15 chars) to avoid false positives
+        # e.g., "html" shouldn't match "practico de html y css"
+        original_tail = original_no_prefix if len(original_no_prefix) > 15 else None
+        clean_tail = clean_no_prefix if len(clean_no_prefix) > 15 else None
+
         # Try in learning paths (subdirectories) with flexible matching
-        for learning_path in courses_base.iterdir():
-            if not learning_path.is_dir():
-                continue
+        for (course_dir, dir_normalized, dir_long, dir_very_long,
+             dir_core, dir_core_head, dir_tail) in self._course_dir_index(courses_base):
+            # Multiple matching strategies (from most specific to most flexible)
+            # Strategy 1: Exact match after normalization
+            if original_normalized == dir_normalized or clean_normalized == dir_normalized:
+                return course_dir
             
-            for course_dir in learning_path.iterdir():
-                if not course_dir.is_dir():
-                    continue
-                
-                # Check if directory has content
-                try:
-                    if not any(course_dir.iterdir()):
-                        continue
-                except:
-                    continue
-                
-                # Normalize the directory name and remove numeric prefixes (e.g., "1. ", "10. ")
-                dir_name = course_dir.name
-                
-                # Remove numeric prefix if present (e.g., "1. Curso..." -> "Curso...")
-                import re
-                dir_name = re.sub(r'^\d+\.\s*', '', dir_name)
-                
-                course_dir_normalized = normalize(dir_name)
-                
-                # Multiple matching strategies (from most specific to most flexible)
-                # Strategy 1: Exact match after normalization
-                if original_normalized == course_dir_normalized or clean_normalized == course_dir_normalized:
-                    return course_dir
-                
-                # Strategy 2: One is substring of the other (for truncated names)
-                # Be more lenient with truncated names (at least 40 chars match)
-                # BUT: Make sure it's not a false positive (e.g., "html" in "practico de html")
-                min_match_len = 40
-                
-                if len(original_normalized) >= min_match_len and len(course_dir_normalized) >= min_match_len:
+            # Strategy 2: One is substring of the other (for truncated names)
+            # BUT: Make sure it's not a false positive (e.g., "html" in "practico de html")
+            if dir_long:
+                if original_long:
                     # Check if one is substring of the other
-                    if course_dir_normalized in original_normalized:
+                    if dir_normalized in original_normalized:
                         # course_dir is substring of original (truncation case)
                         return course_dir
-                    elif original_normalized in course_dir_normalized:
+                    elif original_normalized in dir_normalized:
                         # original is substring of course_dir (should be rare, but possible)
                         # Additional check: make sure the match is at the beginning (not random substring)
-                        if course_dir_normalized.startswith(original_normalized[:30]):
+                        if dir_normalized.startswith(original_head):
                             return course_dir
                 
-                if len(clean_normalized) >= min_match_len and len(course_dir_normalized) >= min_match_len:
-                    if course_dir_normalized in clean_normalized:
+                if clean_long:
+                    if dir_normalized in clean_normalized:
                         return course_dir
-                    elif clean_normalized in course_dir_normalized:
-                        if course_dir_normalized.startswith(clean_normalized[:30]):
+                    elif clean_normalized in dir_normalized:
+                        if dir_normalized.startswith(clean_head):
                             return course_dir
-                
-                # Strategy 3: Core match (first 50 chars) for very long names
-                course_dir_core = course_dir_normalized[:50] if len(course_dir_normalized) > 50 else course_dir_normalized
-                
-                # Match if cores are very similar (at least 45 chars)
-                if len(core_normalized) >= 45 and len(course_dir_core) >= 45:
-                    if core_normalized[:45] == course_dir_core[:45]:
-                        return course_dir
-                
-                # For shorter cores, allow substring matching
-                if core_normalized == course_dir_core or (len(core_normalized) > 30 and core_normalized in course_dir_core):
+
+            # Strategy 3: Core match (first 50 chars) for very long names
+            # Match if cores are very similar (at least 45 chars)
+            if core_head is not None and core_head == dir_core_head:
+                return course_dir
+
+            # For shorter cores, allow substring matching
+            if core_normalized == dir_core or (core_substring and core_normalized in dir_core):
+                return course_dir
+
+            # Also try: if course_dir is very similar to start of original
+            if dir_very_long and original_normalized.startswith(dir_normalized):
+                return course_dir
+
+            # Strategy 4: Remove common prefixes ("Curso de ", "Curso ", etc.) and match
+            if dir_tail is not None:
+                if original_tail is not None and (original_tail in dir_tail or dir_tail in original_tail):
                     return course_dir
                 
-                # Also try: if course_dir is very similar to start of original
-                if len(course_dir_normalized) >= 50 and course_dir_normalized == original_normalized[:len(course_dir_normalized)]:
+                if clean_tail is not None and (clean_tail in dir_tail or dir_tail in clean_tail):
                     return course_dir
-                
-                # Strategy 4: Remove common prefixes and match
-                # Remove "Curso de ", "Curso ", etc.
-                # BUT: Only if the remaining text is long enough to avoid false positives
-                def remove_prefix(text):
-                    prefixes = ['curso de ', 'curso ', 'audiocurso de ', 'audiocurso ']
-                    for prefix in prefixes:
-                        if text.startswith(prefix):
-                            return text[len(prefix):]
-                    return text
-                
-                original_no_prefix = remove_prefix(original_normalized)
-                clean_no_prefix = remove_prefix(clean_normalized)
-                dir_no_prefix = remove_prefix(course_dir_normalized)
-                
-                # Only match if the remaining text is substantial (>15 chars) to avoid false positives
-                # e.g., "html" shouldn't match "practico de html y css"
-                if len(original_no_prefix) > 15 and len(dir_no_prefix) > 15:
-                    if original_no_prefix in dir_no_prefix or dir_no_prefix in original_no_prefix:
-                        return course_dir
-                
-                if len(clean_no_prefix) > 15 and len(dir_no_prefix) > 15:
-                    if clean_no_prefix in dir_no_prefix or dir_no_prefix in clean_no_prefix:
-                        return course_dir
         
         return None
     
     def _clean_string(self, text: str, max_length: int = 80) -> str:
         """Clean string for filesystem."""
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            text = text.replace(char, '')
+        text = text.translate(_INVALID_FILENAME_CHARS)
         
         if len(text) > max_length:
             text = text[:max_length].rstrip()
@@ -498,17 +653,22 @@ class ProgressManager:
         if not self.data:
             return
         
-        print("\n" + "="*100)
-        print("📚 COURSES LIST")
+        out: List[str] = []
+        add = out.append
+
+        add("\n" + _RULE)
+        add("📚 COURSES LIST")
         if filter_status:
-            print(f"Filtering by status: {filter_status}")
-        print("="*100 + "\n")
+            add(f"Filtering by status: {filter_status}")
+        add(_RULE + "\n")
         
         courses = self.data.get("courses", {})
         if not courses:
-            print("No courses found")
+            add("No courses found")
+            sys.stdout.write("\n".join(out) + "\n")
             return
         
+        unit_counters = self._unit_counters()
         for idx, (course_id, course_data) in enumerate(courses.items(), 1):
             status = course_data.get("status", "unknown")
             
@@ -518,33 +678,26 @@ class ProgressManager:
             title = course_data.get("title", "Unknown")
             units = course_data.get("units", {})
             
-            # Count unit statuses
-            completed = sum(1 for u in units.values() if u.get("status") == "completed")
-            failed = sum(1 for u in units.values() if u.get("status") == "failed")
-            pending = sum(1 for u in units.values() if u.get("status") in ["pending", "in_progress"])
+            # Count unit statuses (in_progress is listed as pending)
+            counts = unit_counters[course_id]
+            completed, failed = counts[STATUS_COMPLETED], counts[STATUS_FAILED]
+            pending = counts[STATUS_PENDING] + counts[STATUS_IN_PROGRESS]
             
-            # Status icon
-            if status == "completed":
-                icon = "✅"
-            elif status == "failed":
-                icon = "❌"
-            elif status == "in_progress":
-                icon = "🔄"
-            else:
-                icon = "⏸️"
+            icon = _STATUS_ICONS.get(status, "⏸️")
             
-            print(f"{idx}. {icon} {title}")
-            print(f"   Status: {status}")
-            print(f"   Units: {completed}/{len(units)} completed", end="")
+            add(f"{idx}. {icon} {title}")
+            add(f"   Status: {status}")
+            units_line = f"   Units: {completed}/{len(units)} completed"
             if failed > 0:
-                print(f", {failed} failed", end="")
+                units_line += f", {failed} failed"
             if pending > 0:
-                print(f", {pending} pending", end="")
-            print()
-            print(f"   ID: {course_id}")
-            print()
+                units_line += f", {pending} pending"
+            add(units_line)
+            add(f"   ID: {course_id}")
+            add("")
         
-        print("="*100)
+        add(_RULE)
+        sys.stdout.write("\n".join(out) + "\n")
 
 
 def main():
@@ -576,6 +729,9 @@ Examples:
   
   # List only failed courses
   python platzi_manager.py --list-courses --filter-status failed
+
+  # Save the checkpoint as compact JSON (smaller, faster to write for large files)
+  python platzi_manager.py --retry-failed --compact
         """
     )
     
@@ -623,7 +779,7 @@ Examples:
     
     parser.add_argument(
         '--filter-status',
-        choices=['completed', 'failed', 'in_progress', 'pending'],
+        choices=[STATUS_COMPLETED, STATUS_FAILED, STATUS_IN_PROGRESS, STATUS_PENDING],
         help='Filter courses by status (use with --list-courses)'
     )
     
@@ -633,10 +789,16 @@ Examples:
         help='Preview changes without modifying files'
     )
     
+    parser.add_argument(
+        '--compact',
+        action='store_true',
+        help='Write the checkpoint as compact JSON (default: indented)'
+    )
+
     args = parser.parse_args()
     
     # Create manager
-    manager = ProgressManager(args.checkpoint)
+    manager = ProgressManager(args.checkpoint, compact=args.compact)
     
     if not manager.data:
         sys.exit(1)
@@ -647,7 +809,7 @@ Examples:
     
     elif args.retry_failed:
         print("\n🔄 Retrying Failed Downloads")
-        print("="*100 + "\n")
+        print(_RULE + "\n")
         if args.dry_run:
             print("⚠️  DRY-RUN MODE\n")
         count = manager.retry_failed(dry_run=args.dry_run)
@@ -656,14 +818,14 @@ Examples:
     
     elif args.reset_course:
         print(f"\n🔄 Resetting Course: {args.reset_course}")
-        print("="*100 + "\n")
+        print(_RULE + "\n")
         if args.dry_run:
             print("⚠️  DRY-RUN MODE\n")
         manager.reset_course(args.reset_course, dry_run=args.dry_run)
     
     elif args.clean_tracking:
         print("\n🧹 Cleaning Tracking")
-        print("="*100 + "\n")
+        print(_RULE + "\n")
         if args.dry_run:
             print("⚠️  DRY-RUN MODE\n")
         courses_removed, units_removed = manager.clean_tracking(dry_run=args.dry_run)
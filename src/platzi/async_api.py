@@ -1,11 +1,13 @@
 import asyncio
 import functools
-import json
 import os
+import re
 import shutil
+import statistics
 import time
+from collections import deque
 from pathlib import Path
-from urllib.parse import unquote, urlparse
+from urllib.parse import unquote, urljoin, urlparse, urlsplit
 
 import aiofiles
 from playwright.async_api import BrowserContext, Page, async_playwright
@@ -21,7 +23,7 @@ from .collectors import (
     get_learning_path_title,
     get_unit,
 )
-from .constants import HEADERS, LOGIN_DETAILS_URL, LOGIN_URL, SESSION_FILE
+from .constants import HEADERS, LOGIN_DETAILS_URL, LOGIN_URL, PROFILE_FILE, PROFILE_TTL, SESSION_FILE
 from .dash import dash_dl
 from .helpers import read_json, write_json
 from .logger import Logger
@@ -66,6 +68,266 @@ def try_except_request(func):
     return wrapper
 
 
+# Sequence number in an HLS fragment's file name, e.g. media_123.ts or seg-45-v1-a1.ts.
+# The number must end there, so names like chunk_720p_3.ts don't yield the rendition
+FRAGMENT_SEQUENCE_RE = re.compile(r'(?:media[-_]|seg[-_]|frag[-_]|chunk[-_])(\d+)(?![0-9A-Za-z])')
+
+# Seconds a fragment that arrived ahead of a gap in the sequence is held back, waiting for
+# the missing ones, before the stream gives up on them and moves past the gap
+FRAGMENT_REORDER_WAIT = 5
+
+# Video.js duration display: MM:SS or HH:MM:SS
+DOM_DURATION_RE = re.compile(r'^(?:(\d+):)?(\d+):(\d+)$')
+
+# Pages a browser context may open before it is recycled to release the memory it accumulates
+CONTEXT_RECYCLE_PAGES = 25
+
+# Player controller injected into the interception page before any navigation (and
+# re-run on every reload), so the capture loop only sends short calls instead of
+# shipping and compiling the same function bodies on every poll
+VIDEO_CONTROLLER_JS = """
+window.__platziCtl = {
+    // Kept up to date by the playback listeners below
+    lastAdvance: performance.now(),
+    ended: false,
+
+    // Mute, switch to 4x and start playback
+    start() {
+        const video = document.querySelector('video');
+        if (!video) {
+            console.log('⚠️ No video element found');
+            return null;
+        }
+        video.muted = true;  // Mute to allow autoplay
+        video.playbackRate = 4.0;  // Balanced speed and accuracy
+        video.play().catch(e => console.log('Play failed:', e));
+        console.log('🎬 Video playback started at 4x speed');
+
+        // Check if duration is valid (not NaN or Infinity)
+        const duration = (video.duration && isFinite(video.duration)) ? video.duration : null;
+        return {duration: duration, paused: video.paused, currentTime: video.currentTime};
+    },
+
+    // Keep the video playing at 4x and, if `jump` is set, jump forward to force loading
+    // more fragments
+    tick(jump = true) {
+        const video = document.querySelector('video');
+        if (!video) {
+            return null;
+        }
+        if (video.paused) {
+            video.play().catch(e => console.log('Play failed:', e));
+        }
+        if (video.playbackRate < 4) {
+            video.playbackRate = 4.0;
+        }
+        let jumped = false;
+
+        // Only jump if duration is valid (not NaN)
+        if (isFinite(video.duration) && isFinite(video.currentTime)) {
+            // If we're near the end (last 15 seconds), pause to prevent autoplay to next class
+            if (video.currentTime >= video.duration - 15) {
+                video.pause();
+                console.log('⏸️ Video near end - paused to prevent next class');
+            } else if (jump) {
+                const jumpTo = Math.min(video.currentTime + 60, video.duration - 15);
+                if (jumpTo > video.currentTime && jumpTo < video.duration) {
+                    video.currentTime = jumpTo;
+                    jumped = true;
+                }
+            }
+        }
+
+        // DOM time display for better stuck detection
+        const currentTimeDisplay = document.querySelector('.vjs-current-time-display');
+
+        return {
+            currentTime: isFinite(video.currentTime) ? video.currentTime : null,
+            duration: isFinite(video.duration) ? video.duration : null,
+            paused: video.paused,
+            domCurrentTime: currentTimeDisplay ? currentTimeDisplay.textContent.trim() : null,
+            stalledFor: (performance.now() - this.lastAdvance) / 1000,
+            ended: this.ended || video.ended,
+            jumped: jumped
+        };
+    },
+
+    // Restart playback at 4x from `position` seconds after a reload
+    resume(position) {
+        const video = document.querySelector('video');
+        if (video) {
+            video.muted = true;
+            video.playbackRate = 4.0;
+            video.currentTime = position;
+            video.play().catch(e => console.log('Play failed:', e));
+            console.log(`🎬 Video resumed from ${Math.round(position)}s at 4x speed`);
+        }
+    },
+
+    // Forced seek to `target` seconds to unstick the video
+    jump(target) {
+        const video = document.querySelector('video');
+        if (video) {
+            video.currentTime = target;
+            video.play().catch(e => console.log('Play failed:', e));
+            console.log(`⚡ Forced aggressive seek to ${target}s`);
+        }
+    },
+
+    // Seek forward a minute when no new fragments are arriving
+    nudge() {
+        const video = document.querySelector('video');
+        if (video && video.duration > 0) {
+            video.currentTime = Math.min(video.currentTime + 60, video.duration - 10);
+            video.play().catch(e => console.log('Play error:', e));
+            console.log('Seeking forward to load more fragments...');
+        }
+    },
+
+    // Current playback position, used to confirm the video reached its end
+    position() {
+        const video = document.querySelector('video');
+        if (!video) {
+            return null;
+        }
+        return {
+            currentTime: isFinite(video.currentTime) ? video.currentTime : 0,
+            duration: isFinite(video.duration) ? video.duration : 0
+        };
+    }
+};
+
+// Media events don't bubble, so listen in the capture phase to catch the player's video
+// whenever it is created. Only small forward steps count as playback: a seek moves
+// currentTime by a minute or more without the video actually playing
+(() => {
+    const ctl = window.__platziCtl;
+    let lastTime = null;
+    document.addEventListener('timeupdate', event => {
+        const video = event.target;
+        if (!(video instanceof HTMLVideoElement)) {
+            return;
+        }
+        const delta = lastTime === null ? 0 : video.currentTime - lastTime;
+        lastTime = video.currentTime;
+        if (delta > 0 && delta < 5) {
+            ctl.lastAdvance = performance.now();
+        }
+    }, true);
+    document.addEventListener('ended', event => {
+        if (event.target instanceof HTMLVideoElement) {
+            ctl.ended = true;
+        }
+    }, true);
+})();
+"""
+
+
+def _fragment_sequence(path: str):
+    """Sequence number from the file name of a fragment URL path, or None if it has none.
+
+    Only the last path component is searched, so directory names such as
+    ``chunk_720p/`` or ``media_1080/`` can't be mistaken for the sequence.
+    """
+    match = FRAGMENT_SEQUENCE_RE.search(path.rsplit('/', 1)[-1])
+    return int(match.group(1)) if match else None
+
+
+def _link_or_copy(src, dst):
+    """Hard-link src to dst, falling back to a copy across filesystems or where links aren't supported."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+class FragmentWriter:
+    """Appends captured fragments to one stream in sequence order.
+
+    Fragment bodies finish downloading in any order, so the ones that arrive ahead
+    of a gap are held back until the missing ones land. A gap is given up on once
+    the oldest held fragment has waited ``reorder_wait`` seconds, right away when a
+    seek explains it, and at the end of the capture. Fragments without a sequence
+    number, or behind the point the stream already reached, go in arrival order.
+    """
+
+    def __init__(self, on_written, reorder_wait: float = FRAGMENT_REORDER_WAIT):
+        self.on_written = on_written  # Called with each [(sequence, body)] run after it is written
+        self.reorder_wait = reorder_wait
+        self.next_sequence = None  # Sequence the stream expects next
+        self._queue = asyncio.Queue()
+        self._pending = {}  # sequence -> (body, arrival time)
+        self._seeked = False
+
+    def expect(self, sequence: int) -> None:
+        """Start the stream at ``sequence``, the first fragment the player asked for."""
+        if self.next_sequence is None:
+            self.next_sequence = sequence
+
+    def seeked(self) -> None:
+        """The player jumped, so the next gap will not be filled: skip it without waiting."""
+        self._seeked = True
+
+    def put(self, sequence, body: bytes) -> None:
+        self._queue.put_nowait((sequence, body))
+
+    def close(self) -> None:
+        """Write what is left once the fragments already put are done; ends ``run``."""
+        self._queue.put_nowait(None)
+
+    def _take_run(self, ready: list) -> None:
+        """Move the held fragments that continue the stream to ``ready``."""
+        pending = self._pending
+        while self.next_sequence in pending:
+            ready.append((self.next_sequence, pending.pop(self.next_sequence)[0]))
+            self.next_sequence += 1
+
+    async def run(self, stream) -> None:
+        """Write fragments to ``stream`` (anything with an async ``writelines``) until closed."""
+        loop = asyncio.get_running_loop()
+        pending = self._pending
+        finished = False
+        while not finished:
+            # Take everything that queued up during the previous write. While
+            # fragments are held back, only wait until the oldest one's time is up
+            timeout = None
+            if pending:
+                oldest = min(arrived for _, arrived in pending.values())
+                timeout = max(0, oldest + self.reorder_wait - loop.time())
+            try:
+                batch = [await asyncio.wait_for(self._queue.get(), timeout)]
+            except asyncio.TimeoutError:
+                batch = []
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            if batch and batch[-1] is None:  # close() is only called after the last fragment
+                batch.pop()
+                finished = True
+
+            now = loop.time()
+            ready = []
+            for sequence, body in batch:
+                if sequence is None or (self.next_sequence is not None and sequence < self.next_sequence):
+                    ready.append((sequence, body))
+                else:
+                    pending[sequence] = (body, now)
+                    self._take_run(ready)
+
+            # Carry on from the lowest held sequence once the gap in front of it is given up on
+            while pending and self.next_sequence not in pending:
+                oldest = min(arrived for _, arrived in pending.values())
+                if not (finished or self._seeked or now >= oldest + self.reorder_wait):
+                    break
+                self._seeked = False
+                self.next_sequence = min(pending)
+                self._take_run(ready)
+            if not ready:
+                continue
+
+            # Hand the whole run to the file in one call
+            await stream.writelines([body for _, body in ready])
+            self.on_written(ready)
+
 
 class AsyncPlatzi:
     def __init__(self, headless=True, browser_type="firefox"):
@@ -74,10 +336,11 @@ class AsyncPlatzi:
         self.headless = headless  # Respect user's headless preference for all browsers
         self.user = None
         self.progress = ProgressTracker()
+        self._pages_opened = 0
+        self._page_lock = asyncio.Lock()  # serializes page creation with context recycling
+        self._course_dir_index = {}  # learning path folder -> [(dir name, dir path)]
 
     async def __aenter__(self):
-        from .constants import USER_AGENT
-        
         self._playwright = await async_playwright().start()
         
         # Launch browser based on browser_type
@@ -128,6 +391,9 @@ class AsyncPlatzi:
                     # Network settings
                     'network.proxy.type': 0,
                     'network.dns.disablePrefetch': True,
+                    # Keep more connections open to the video CDN so fragment requests reuse them
+                    'network.http.max-persistent-connections-per-server': 16,
+                    'network.http.http2.enabled': True,
                     
                     # Disable ALL security blocks that interfere with page loading
                     'security.mixed_content.block_active_content': False,  # Allow mixed HTTP/HTTPS
@@ -161,8 +427,51 @@ class AsyncPlatzi:
                 }
             )
         
+        self._context = await self._new_context()
+
+        try:
+            await self._load_state()
+        except Exception:
+            pass
+
+        await self._set_profile()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        # Generate and save final report
+        print("\n")
+        print(self.progress.generate_report())
+        self.progress.save_final_report()
+        
+        await self._context.close()
+        await self._browser.close()
+        await self._playwright.stop()
+
+    @property
+    async def page(self) -> Page:
+        # Contexts keep growing with every page they host; swap in a fresh one once
+        # enough pages went through it and none is still open. Prefetch tasks ask for
+        # pages concurrently, so the check, the recycle and the new page happen under
+        # one lock and no page is opened in a context that is about to be closed
+        async with self._page_lock:
+            if self._pages_opened >= CONTEXT_RECYCLE_PAGES and not self._context.pages:
+                await self._recycle_context()
+            new_page = await self._context.new_page()
+        # Minimize Chromium pages immediately after creation
+        if self.browser_type == "chromium":
+            await self._minimize_page(new_page)
+        return new_page
+
+    @property
+    def context(self) -> BrowserContext:
+        return self._context
+
+    async def _new_context(self, storage_state=None) -> BrowserContext:
+        """Create a browser context with the downloader's settings and scripts."""
+        from .constants import USER_AGENT
+
         # Create browser context with optimized settings
-        self._context = await self._browser.new_context(
+        context = await self._browser.new_context(
             user_agent=USER_AGENT,
             viewport={'width': 1920, 'height': 1080},
             locale='es-ES',
@@ -172,13 +481,14 @@ class AsyncPlatzi:
             extra_http_headers={
                 'Referer': 'https://platzi.com/',
             },
+            storage_state=storage_state,
         )
-        
+
         # Set default timeout to 60 seconds for all operations (better for Firefox headless)
-        self._context.set_default_timeout(60000)
-        
+        context.set_default_timeout(60000)
+
         # Add anti-detection script
-        await self._context.add_init_script("""
+        await context.add_init_script("""
             Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
             window.navigator.chrome = {runtime: {}};
             const originalQuery = window.navigator.permissions.query;
@@ -187,53 +497,46 @@ class AsyncPlatzi:
                     Promise.resolve({ state: Notification.permission }) :
                     originalQuery(parameters)
             );
-            
+
             // Override plugins
             Object.defineProperty(navigator, 'plugins', {
                 get: () => [1, 2, 3, 4, 5]
             });
-            
+
             // Override languages
             Object.defineProperty(navigator, 'languages', {
                 get: () => ['es-ES', 'es', 'en-US', 'en']
             });
         """)
 
-        try:
-            await self._load_state()
-        except Exception:
-            pass
+        # Count every page opened in this context, including ones created directly
+        context.on("page", self._on_new_page)
+        return context
 
-        await self._set_profile()
-        return self
+    def _on_new_page(self, page: Page) -> None:
+        self._pages_opened += 1
 
-    async def __aexit__(self, exc_type, exc, tb):
-        # Generate and save final report
-        print("\n")
-        print(self.progress.generate_report())
-        self.progress.save_final_report()
-        
+    async def _recycle_context(self) -> None:
+        """Replace the browser context with a fresh one that keeps the session."""
+        state = await self._context.storage_state()
         await self._context.close()
-        await self._browser.close()
-        await self._playwright.stop()
-
-    @property
-    async def page(self) -> Page:
-        new_page = await self._context.new_page()
-        # Minimize Chromium pages immediately after creation
-        if self.browser_type == "chromium":
-            await self._minimize_page(new_page)
-        return new_page
-
-    @property
-    def context(self) -> BrowserContext:
-        return self._context
+        self._context = await self._new_context(storage_state=state)
+        self._pages_opened = 0
+        Logger.debug("♻️  Browser context recycled")
 
     @try_except_request
     async def _set_profile(self) -> None:
         try:
-            data = await self.get_json(LOGIN_DETAILS_URL)
-            self.user = User(**data)
+            self.user = self._cached_profile()
+            if self.user is None:
+                # Let pydantic parse the raw JSON directly instead of going through a dict
+                raw = await self.get_text(LOGIN_DETAILS_URL)
+                self.user = User.model_validate_json(raw or "{}")
+                if self.user.is_authenticated:
+                    try:
+                        PROFILE_FILE.write_text(raw, encoding="utf-8")
+                    except OSError as e:
+                        Logger.debug(f"Could not cache the profile: {e}")
         except Exception:
             return
 
@@ -241,6 +544,18 @@ class AsyncPlatzi:
             self.loggedin = True
             Logger.info(f"Hi, {self.user.username}!\n")
 
+    def _cached_profile(self) -> User | None:
+        """Return the profile saved by a recent run, skipping the round-trip to fetch it.
+
+        The cache is dropped on login/logout and trusted for PROFILE_TTL seconds.
+        """
+        try:
+            if time.time() - PROFILE_FILE.stat().st_mtime > PROFILE_TTL:
+                return None
+            return User.model_validate_json(PROFILE_FILE.read_bytes())
+        except Exception:  # no cache yet, or unreadable
+            return None
+
     async def _minimize_page(self, page: Page) -> None:
         """Minimize Chromium page on Windows to avoid being a nuisance."""
         try:
@@ -248,10 +563,9 @@ class AsyncPlatzi:
             if platform.system() == "Windows":
                 try:
                     import ctypes
-                    import time
                     
-                    # Small delay to let window appear
-                    time.sleep(0.3)
+                    # Small delay to let window appear (without blocking the event loop)
+                    await asyncio.sleep(0.3)
                     
                     # Get foreground window (most recently created)
                     hwnd = ctypes.windll.user32.GetForegroundWindow()
@@ -279,6 +593,7 @@ class AsyncPlatzi:
             if avatar:
                 self.loggedin = True
                 await self._save_state()
+                PROFILE_FILE.unlink(missing_ok=True)  # fetch the new account's profile next time
                 Logger.info("Logged in successfully")
         except Exception:
             raise Exception("Login failed")
@@ -288,8 +603,35 @@ class AsyncPlatzi:
     @try_except_request
     async def logout(self):
         SESSION_FILE.unlink(missing_ok=True)
+        PROFILE_FILE.unlink(missing_ok=True)
         Logger.info("Logged out successfully")
 
+    def _scan_course_dirs(self, path_folder: Path) -> list:
+        try:
+            with os.scandir(path_folder) as entries:
+                dirs = [(entry.name, Path(entry.path)) for entry in entries if entry.is_dir()]
+        except OSError:
+            dirs = []
+        self._course_dir_index[path_folder] = dirs
+        return dirs
+
+    def _find_course_dir(self, path_folder: Path, clean_course_title: str):
+        """Find the folder of a course inside a learning path folder.
+
+        Listings are cached per learning path and re-read once on a miss, since
+        courses downloaded later in the run add new folders.
+        """
+        dirs = self._course_dir_index.get(path_folder)
+        fresh = dirs is None
+        if fresh:
+            dirs = self._scan_course_dirs(path_folder)
+
+        match = next((path for name, path in dirs if clean_course_title in name), None)
+        if match is None and not fresh:
+            dirs = self._scan_course_dirs(path_folder)
+            match = next((path for name, path in dirs if clean_course_title in name), None)
+        return match
+
     async def _copy_course_to_path(self, course_id: str, course_title: str, learning_path_id: str, **kwargs):
         """Copy an already downloaded course to a new learning path folder.
         
@@ -335,35 +677,34 @@ class AsyncPlatzi:
         # Find which index the course has in the original path (this is tricky, we'll search)
         # For now, we'll search for the course folder in the Courses directory
         courses_base = Path("Courses")
-        source_dir = None
+        clean_course_title = clean_string(course_title, max_length=30)
         
         # Search in learning path structure
         original_path_folder = courses_base / clean_string(original_path_title, max_length=35)
-        if original_path_folder.exists():
-            for item in original_path_folder.iterdir():
-                if item.is_dir() and clean_string(course_title, max_length=30) in item.name:
-                    source_dir = item
-                    break
+        source_dir = self._find_course_dir(original_path_folder, clean_course_title)
         
         # If not found in learning path, check if it's a standalone course
         if not source_dir:
             standalone_folder = courses_base / clean_string(course_title, max_length=80)
-            if standalone_folder.exists():
+            if standalone_folder.is_dir():
                 source_dir = standalone_folder
         
-        if not source_dir or not source_dir.exists():
+        # Both lookups above already established that the folder exists
+        if not source_dir:
             Logger.warning(f"Cannot find source directory for course: {course_title}, will re-download")
             return False
         
         # Create destination directory
-        dest_dir = courses_base / clean_string(path_title, max_length=35) / f"{course_index}. {clean_string(course_title, max_length=30)}"
+        dest_dir = courses_base / clean_string(path_title, max_length=35) / f"{course_index}. {clean_course_title}"
         
         try:
             if dest_dir.exists():
                 Logger.info(f"Destination already exists: {dest_dir}")
             else:
                 Logger.info(f"Copying course from {source_dir} to {dest_dir}")
-                shutil.copytree(source_dir, dest_dir)
+                # Hard-link the files when possible: the copy is identical, so there's no
+                # need to duplicate gigabytes of video on the same disk
+                shutil.copytree(source_dir, dest_dir, copy_function=_link_or_copy)
                 Logger.info(f"✅ Course copied successfully to {path_title}")
             
             # Update progress tracker to add this learning path ID
@@ -375,12 +716,47 @@ class AsyncPlatzi:
             Logger.warning(f"Error copying course: {e}, will re-download", exception=e)
             return False
 
+    async def _await_ready(self, page: Page, timeout: float = 5) -> None:
+        """Wait until a freshly committed page is usable, for at most ``timeout`` seconds.
+
+        Races the page 'load' event against the video player showing up and returns
+        as soon as either happens, so fast pages don't sit out the full delay.
+        """
+        waiters = [
+            asyncio.create_task(page.wait_for_load_state('load', timeout=timeout * 1000)),
+            asyncio.create_task(page.wait_for_selector('video, .vjs-duration-display', state='attached', timeout=timeout * 1000)),
+        ]
+        deadline = asyncio.get_running_loop().time() + timeout
+        pending = set(waiters)
+        while pending:
+            remaining = max(0, deadline - asyncio.get_running_loop().time())
+            done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            # Stop on timeout or on the first waiter that succeeded; a failed one leaves the other running
+            if not done or any(waiter.exception() is None for waiter in done):
+                break
+        for waiter in pending:
+            waiter.cancel()
+        # Collect results (and errors) of every waiter so none is left unretrieved
+        await asyncio.gather(*waiters, return_exceptions=True)
+
+    async def _reload_player(self, page: Page, timeout: float = 15) -> None:
+        """Reload a class page and return as soon as its video element is back.
+
+        Waits at most ``timeout`` seconds for the element; if it never shows up the
+        caller's next player call finds no video, as it would have after a fixed sleep.
+        """
+        await page.reload(timeout=30000, wait_until='domcontentloaded')
+        try:
+            await page.wait_for_selector('video', state='attached', timeout=timeout * 1000)
+        except Exception as e:
+            Logger.debug(f"Video element not found after reload: {e}")
+
     async def _goto_with_retry(self, page: Page, url: str, max_retries: int = 3) -> None:
         """Navigate to URL with retry logic for better reliability.
         
         Uses a very aggressive approach: waits only for 'commit' event (earliest possible),
-        then continues immediately with fixed delays instead of waiting for full page load.
-        Uses increasing timeouts for better resilience on slow connections.
+        then gives the page up to a few seconds to become ready instead of waiting for
+        full page load. Uses increasing timeouts for better resilience on slow connections.
         """
         original_page = page
         for attempt in range(max_retries):
@@ -416,8 +792,8 @@ class AsyncPlatzi:
                 # Much more reliable than 'load' or 'domcontentloaded' which may never fire
                 await page.goto(url, timeout=timeout, wait_until='commit')
                 Logger.debug(f"✅ Navigation succeeded on attempt {attempt + 1}")
-                # Fixed delay for JavaScript to execute (more reliable than waiting for events)
-                await asyncio.sleep(5)
+                # Give JavaScript time to execute, but stop waiting once the page is ready
+                await self._await_ready(page)
                 return  # Success
             except Exception as e:
                 error_str = str(e)
@@ -427,7 +803,7 @@ class AsyncPlatzi:
                         current_url = page.url
                         if current_url and current_url != "about:blank" and url in current_url:
                             Logger.warning(f"⚠️  Navigation timeout but page loaded: {current_url}")
-                            await asyncio.sleep(5)  # Fixed delay for JS to execute
+                            await self._await_ready(page)  # Let JS execute
                             return  # Continue despite timeout
                         elif current_url == "about:blank":
                             Logger.warning(f"⚠️  Page stuck on about:blank after timeout")
@@ -481,74 +857,163 @@ class AsyncPlatzi:
         temp_dir = Path('.tmp') / f"browser_intercept_{int(time.time())}"
         temp_dir.mkdir(parents=True, exist_ok=True)
         
-        # Storage for captured fragments
-        captured_fragments = []
-        fragment_lock = asyncio.Lock()
-        fragment_urls_seen = set()  # Avoid duplicates
+        fragments_seen = set()  # Avoid duplicates: sequence numbers, or URL paths when there is none
+        # Fragment bodies are fetched concurrently, bounded so a burst of
+        # responses doesn't hold dozens of bodies at once
+        capture_slots = asyncio.Semaphore(12)
+        capture_tasks = set()
+        # A single writer appends every fragment, in sequence order, to one open stream file
+        stream_path = temp_dir / "fragments.ts"
+        writer_task = None
+        fragment_event = asyncio.Event()  # Set by the writer whenever new fragments are on disk
+        capture_done = asyncio.Event()  # Set once every segment the media playlist lists is on disk
+        playlist_segments = None  # Segment count of the captured stream's complete (VOD) media playlist
+        media_playlists = {}  # Directory of a complete .ts media playlist's segments -> segment count
+        fragment_dirs = set()  # Directories the captured fragments are served from
+        arrival_times = deque(maxlen=10)  # Loop time of the most recent fragment responses
+        page = None
+        listening = False  # Whether handle_response is attached to the page
         
         try:
+            loop = asyncio.get_running_loop()
             # Create new page for interception
             page = await self._context.new_page()
-            
+            await page.add_init_script(VIDEO_CONTROLLER_JS)
+
             # Track maximum video timestamp captured to resume after reload
             max_captured_timestamp = 0
+            # Fragments and bytes written so far, kept as the fragments land so readers
+            # don't have to count them
+            fragments_written = 0
+            total_bytes = 0
             
-            # Setup response interception to capture .ts fragments
-            async def handle_response(response):
-                nonlocal max_captured_timestamp
+            def record_written(ready):
+                nonlocal max_captured_timestamp, fragments_written, total_bytes
+                for sequence_num, content in ready:
+                    if sequence_num is None:
+                        sequence_num = fragments_written
+
+                    fragments_written += 1
+                    total_bytes += len(content)
+
+                    # Update max captured position (approximate: sequence * 10 seconds per fragment)
+                    estimated_timestamp = sequence_num * 10
+                    if estimated_timestamp > max_captured_timestamp:
+                        max_captured_timestamp = estimated_timestamp
+
+                if playlist_segments and fragments_written >= playlist_segments:
+                    capture_done.set()
+
+                # Wake the capture loop
+                fragment_event.set()
+
+            writer = FragmentWriter(record_written)
+
+            async def write_fragments():
+                async with aiofiles.open(stream_path, 'wb') as f:
+                    await writer.run(f)
+
+            writer_task = asyncio.create_task(write_fragments())
+
+            async def capture_fragment(response, sequence_num):
                 try:
-                    # Capture .ts video fragments and .m3u8 playlists
-                    if (('.ts' in response.url or '.m3u8' in response.url) and 
-                        response.status == 200 and 
-                        response.url not in fragment_urls_seen):
-                        
-                        # Avoid duplicate downloads
-                        fragment_urls_seen.add(response.url)
-                        
-                        # Silently capture manifests (shown in debug mode only if needed)
+                    async with capture_slots:
                         # Avoid logging to prevent interference with tqdm progress bar
-                        
                         content = await response.body()
-                        
-                        # Only save .ts fragments (actual video data)
-                        if '.ts' in response.url:
-                            async with fragment_lock:
-                                fragment_index = len(captured_fragments)
-                                fragment_path = temp_dir / f"fragment_{fragment_index:05d}.ts"
-                                
-                                # Write fragment to disk immediately
-                                async with aiofiles.open(fragment_path, 'wb') as f:
-                                    await f.write(content)
-                                
-                                # Try to extract sequence/timestamp from URL for deduplication
-                                # Example: ...media_123.ts or ...seg-45-v1-a1.ts
-                                fragment_url = response.url
-                                import re
-                                seq_match = re.search(r'(?:media[-_]|seg[-_]|frag[-_]|chunk[-_])(\d+)', fragment_url)
-                                sequence_num = int(seq_match.group(1)) if seq_match else fragment_index
-                                
-                                captured_fragments.append({
-                                    'path': fragment_path,
-                                    'index': fragment_index,
-                                    'size': len(content),
-                                    'url': fragment_url,
-                                    'sequence': sequence_num
-                                })
-                                
-                                # Update max captured position (approximate: sequence * 10 seconds per fragment)
-                                estimated_timestamp = sequence_num * 10
-                                if estimated_timestamp > max_captured_timestamp:
-                                    max_captured_timestamp = estimated_timestamp
-                                
-                                # Progress is shown by tqdm bar, no need for debug logs here
-                                pass
+                        writer.put(sequence_num, content)
                 
                 except Exception as e:
                     # Ignore errors in individual fragments to avoid stopping the capture
                     Logger.debug(f"Error capturing fragment: {e}")
             
+            def claim_playlist():
+                """Adopt the segment count of the playlist the captured fragments come from."""
+                nonlocal playlist_segments
+                if playlist_segments is not None:
+                    return
+                for directory in fragment_dirs:
+                    segments = media_playlists.get(directory)
+                    # A playlist listing fewer segments than are already on disk isn't this stream's
+                    if segments and segments >= fragments_written:
+                        playlist_segments = segments
+                        return
+
+            async def read_playlist(response):
+                try:
+                    playlist = await response.text()
+                except Exception as e:
+                    Logger.debug(f"Error reading playlist: {e}")
+                    return
+
+                # Only a complete media playlist tells how many segments the video has;
+                # master playlists and live windows have no end marker, and an I-frame
+                # playlist lists byte ranges of the segments rather than the segments
+                if '#EXT-X-ENDLIST' not in playlist or '#EXT-X-I-FRAMES-ONLY' in playlist:
+                    return
+                paths = [
+                    urlsplit(urljoin(response.url, line.strip())).path
+                    for line in playlist.splitlines()
+                    if line.strip() and not line.startswith('#')
+                ]
+                # Subtitle and audio-only playlists don't list .ts segments
+                if not paths or not all(path.endswith('.ts') for path in paths):
+                    return
+                directories = {path.rsplit('/', 1)[0] for path in paths}
+                if len(directories) == 1:
+                    media_playlists[directories.pop()] = len(paths)
+                    claim_playlist()
+
+            # Setup response interception to capture .ts fragments
+            def handle_response(response):
+                url = response.url
+                if response.status != 200:
+                    return
+
+                # Playlists are read until the captured stream's own is known, to tell when
+                # its last fragment has landed
+                if '.m3u8' in url:
+                    if playlist_segments is None:
+                        task = asyncio.create_task(read_playlist(response))
+                        capture_tasks.add(task)
+                        task.add_done_callback(capture_tasks.discard)
+                    return
+
+                # Only .ts fragments carry video data. Every other response (page assets,
+                # telemetry) is dropped here without fetching its body
+                if '.ts' not in url:
+                    return
+
+                # Try to extract sequence/timestamp from the file name for deduplication
+                # (e.g. media_123.ts or seg-45-v1-a1.ts). Keying on it instead of the URL
+                # also drops a segment re-requested after a seek, reload or rendition switch.
+                # Without one, the path is the key: signed query strings change per request
+                path = urlsplit(url).path
+                sequence_num = _fragment_sequence(path)
+                key = path if sequence_num is None else sequence_num
+
+                # Avoid duplicate downloads
+                if key in fragments_seen:
+                    return
+                fragments_seen.add(key)
+                arrival_times.append(loop.time())
+                # Responses come in the order the player asked for them, so the first
+                # numbered one is where the stream starts
+                if sequence_num is not None:
+                    writer.expect(sequence_num)
+
+                directory = path.rsplit('/', 1)[0]
+                if directory not in fragment_dirs:
+                    fragment_dirs.add(directory)
+                    claim_playlist()
+
+                # Fetch and write in the background so the listener returns right away
+                task = asyncio.create_task(capture_fragment(response, sequence_num))
+                capture_tasks.add(task)
+                task.add_done_callback(capture_tasks.discard)
+
             # Attach response listener BEFORE navigation
             page.on('response', handle_response)
+            listening = True
             
             # Navigate directly to the class page where video is already playing
             if not unit_url:
@@ -567,39 +1032,31 @@ class AsyncPlatzi:
                 Logger.info("⏳ Waiting for video player to load duration...")
                 max_dom_wait = 15  # Wait up to 15 seconds for DOM duration
                 
-                for wait_attempt in range(max_dom_wait):
-                    await asyncio.sleep(1)
+                try:
+                    # Let the page poll the player display itself and hand back the first
+                    # non-zero duration, instead of one evaluate round-trip per second
+                    duration_handle = await page.wait_for_function("""
+                        (() => {
+                            // Try to get duration from video player display
+                            const durationDisplay = document.querySelector('.vjs-duration-display');
+                            const text = durationDisplay ? durationDisplay.textContent.trim() : '';
+                            return /^(\\d+:)?\\d+:\\d+$/.test(text) && /[1-9]/.test(text) ? text : false;
+                        })
+                    """, polling=250, timeout=max_dom_wait * 1000)
+                    duration_text = await duration_handle.json_value()
                     
-                    try:
-                        duration_text = await page.evaluate("""
-                            (() => {
-                                // Try to get duration from video player display
-                                const durationDisplay = document.querySelector('.vjs-duration-display');
-                                if (durationDisplay) {
-                                    return durationDisplay.textContent.trim();
-                                }
-                                return null;
-                            })()
-                        """)
-                        
-                        if duration_text and duration_text != "0:00" and duration_text != "00:00":
-                            # Parse duration text (e.g., "10:35" -> 635 seconds)
-                            parts = duration_text.split(':')
-                            if len(parts) == 2:  # MM:SS
-                                minutes, seconds = int(parts[0]), int(parts[1])
-                                duration_from_dom = minutes * 60 + seconds
-                                if duration_from_dom > 0:  # Valid duration
-                                    Logger.info(f"📹 Video duration from DOM: {minutes}:{seconds:02d} ({duration_from_dom}s)")
-                                    break
-                            elif len(parts) == 3:  # HH:MM:SS
-                                hours, minutes, seconds = int(parts[0]), int(parts[1]), int(parts[2])
-                                duration_from_dom = hours * 3600 + minutes * 60 + seconds
-                                if duration_from_dom > 0:  # Valid duration
-                                    Logger.info(f"📹 Video duration from DOM: {hours}:{minutes:02d}:{seconds:02d} ({duration_from_dom}s)")
-                                    break
-                    except Exception as dom_error:
-                        Logger.debug(f"Error extracting duration from DOM (attempt {wait_attempt + 1}): {dom_error}")
-                        continue
+                    # Parse duration text (e.g., "10:35" -> 635 seconds, "1:02:03" -> 3723 seconds)
+                    hours, minutes, seconds = DOM_DURATION_RE.match(duration_text).groups()
+                    minutes, seconds = int(minutes), int(seconds)
+                    if hours is None:  # MM:SS
+                        duration_from_dom = minutes * 60 + seconds
+                        Logger.info(f"📹 Video duration from DOM: {minutes}:{seconds:02d} ({duration_from_dom}s)")
+                    else:  # HH:MM:SS
+                        hours = int(hours)
+                        duration_from_dom = hours * 3600 + minutes * 60 + seconds
+                        Logger.info(f"📹 Video duration from DOM: {hours}:{minutes:02d}:{seconds:02d} ({duration_from_dom}s)")
+                except Exception as dom_error:
+                    Logger.debug(f"Error extracting duration from DOM: {dom_error}")
                 
                 if not duration_from_dom:
                     Logger.debug("Could not extract valid duration from DOM after 15 seconds")
@@ -607,36 +1064,7 @@ class AsyncPlatzi:
                 # Try to find and configure video for fast download
                 video_info = None
                 try:
-                    video_info = await page.evaluate("""
-                        (() => {
-                            const video = document.querySelector('video');
-                            if (video) {
-                                // Mute to allow autoplay
-                                video.muted = true;
-                                
-                                // Set playback rate to 4x (balanced speed and accuracy)
-                                video.playbackRate = 4.0;
-                                
-                                // Try to play
-                                video.play().catch(e => console.log('Play failed:', e));
-                                
-                                console.log('🎬 Video playback started at 4x speed');
-                                
-                                // Return video info
-                                // Check if duration is valid (not NaN or Infinity)
-                                const duration = (video.duration && isFinite(video.duration)) ? video.duration : null;
-                                
-                                return {
-                                    duration: duration,
-                                    paused: video.paused,
-                                    currentTime: video.currentTime
-                                };
-                            } else {
-                                console.log('⚠️ No video element found');
-                                return null;
-                            }
-                        })()
-                    """)
+                    video_info = await page.evaluate("window.__platziCtl.start()")
                     
                     # If we got duration from DOM but not from video element, use DOM duration
                     if duration_from_dom and (not video_info or not video_info.get('duration')):
@@ -673,35 +1101,32 @@ class AsyncPlatzi:
                     Logger.info("⏳ Waiting for video.duration to load...")
                     max_duration_wait = 15  # Reduced since we already waited for DOM
                     
-                    for wait_second in range(max_duration_wait):
-                        await asyncio.sleep(1)
+                    try:
+                        # Resolves as soon as the element reports a finite duration
+                        check_handle = await page.wait_for_function("""
+                            (() => {
+                                const video = document.querySelector('video');
+                                if (video && video.duration && isFinite(video.duration)) {
+                                    return {
+                                        duration: video.duration,
+                                        currentTime: video.currentTime,
+                                        paused: video.paused
+                                    };
+                                }
+                                return null;
+                            })
+                        """, polling=250, timeout=max_duration_wait * 1000)
+                        check_info = await check_handle.json_value()
                         
-                        try:
-                            check_info = await page.evaluate("""
-                                (() => {
-                                    const video = document.querySelector('video');
-                                    if (video && video.duration && isFinite(video.duration)) {
-                                        return {
-                                            duration: video.duration,
-                                            currentTime: video.currentTime,
-                                            paused: video.paused
-                                        };
-                                    }
-                                    return null;
-                                })()
-                            """)
-                            
-                            if check_info and check_info.get('duration'):
-                                duration = float(check_info['duration'])
-                                if duration > 0 and duration < float('inf'):
-                                    video_info = check_info
-                                    duration_minutes = duration / 60
-                                    Logger.info(f"✅ Video duration obtained: {duration_minutes:.1f} minutes ({duration:.0f}s)")
-                                    Logger.info(f"⚡ Playback speed set to 4x for accurate capture")
-                                    break
-                        except Exception as e:
-                            Logger.debug(f"Error checking duration: {e}")
-                            continue
+                        if check_info and check_info.get('duration'):
+                            duration = float(check_info['duration'])
+                            if duration > 0 and duration < float('inf'):
+                                video_info = check_info
+                                duration_minutes = duration / 60
+                                Logger.info(f"✅ Video duration obtained: {duration_minutes:.1f} minutes ({duration:.0f}s)")
+                                Logger.info(f"⚡ Playback speed set to 4x for accurate capture")
+                    except Exception as e:
+                        Logger.debug(f"Error checking duration: {e}")
                     
                     # If still no duration after waiting, warn but continue
                     if video_info is None or video_info.get('duration') is None:
@@ -746,8 +1171,8 @@ class AsyncPlatzi:
                 max_wait_time = 900  # 15 minutes for unknown duration
             last_fragment_count = 0
             no_progress_seconds = 0
-            seek_interval = 15  # Seek forward every 15 seconds
-            seconds_since_seek = 0
+            seek_interval = 15  # Probe the player this often until fragment responses set the pace
+            jump_interval = 15  # Jump forward at most this often, whatever the probe pace
             # initial_video_duration already set above if we have duration
             video_ended = False
             last_video_position = 0  # Track if video is stuck
@@ -758,83 +1183,80 @@ class AsyncPlatzi:
             
             # Use tqdm progress bar similar to m3u8 download
             bar_format = "{desc} |{bar}| {n} fragments [{elapsed}, {rate_fmt}{postfix}]"
-            with tqdm(desc="Capturing", colour='cyan', bar_format=bar_format, ascii='░█', unit=' frags', total=expected_fragments) as progress_bar:
-                for second in range(max_wait_time):
-                    await asyncio.sleep(1)
-                    current_count = len(captured_fragments)
-                    seconds_since_seek += 1
+            started = loop.time()
+            deadline = started + max_wait_time
+            last_seek = started
+            last_jump = started
+            last_progress = started  # When new fragments last arrived
+            last_status = started  # When the periodic status line was last written
+            last_wait_note = started  # When the "waiting for the end" line was last written
+            percent_per_fragment = 100 / expected_fragments if expected_fragments else 0
+            with tqdm(desc="Capturing", colour='cyan', bar_format=bar_format, ascii='░█', unit=' frags', total=expected_fragments, mininterval=0.5, smoothing=0.1) as progress_bar:
+                while loop.time() < deadline:
+                    # Sleep until the writer reports new fragments or the next check is due,
+                    # instead of waking every second to poll the fragment count
+                    now = loop.time()
+                    if len(arrival_times) >= 4:
+                        # Probe at twice the median gap between recent fragment responses, kept
+                        # within 3-30 seconds, so the check follows the pace the player fetches at
+                        times = list(arrival_times)
+                        gap = statistics.median(b - a for a, b in zip(times, times[1:]))
+                        seek_interval = max(3, min(30, 2 * gap))
+                    next_seek = last_seek + seek_interval
+                    wake_at = min(next_seek, deadline)
+                    if last_progress + 60 > now:
+                        wake_at = min(wake_at, last_progress + 60)
+                    try:
+                        await asyncio.wait_for(fragment_event.wait(), timeout=wake_at - now)
+                    except asyncio.TimeoutError:
+                        pass
+                    fragment_event.clear()
+                    now = loop.time()
+                    current_count = fragments_written
                     
                     # Update progress bar if we have new fragments
                     if current_count > last_fragment_count:
                         new_fragments = current_count - last_fragment_count
-                        total_mb = sum(f['size'] for f in captured_fragments) / 1024 / 1024
+                        total_mb = total_bytes / 1024 / 1024
+                        # Let update() draw the new postfix, subject to the bar's refresh interval
+                        progress_bar.set_postfix_str(f"{total_mb:.1f} MB", refresh=False)
                         progress_bar.update(new_fragments)
-                        progress_bar.set_postfix_str(f"{total_mb:.1f} MB")
                         last_fragment_count = current_count
-                        no_progress_seconds = 0
-                    else:
-                        no_progress_seconds += 1
+                        last_progress = now
+                    no_progress_seconds = now - last_progress
                     
-                    # Periodically seek forward to force loading more fragments
-                    if seconds_since_seek >= seek_interval:
-                        seconds_since_seek = 0
+                    # Every segment the playlist lists is on disk: nothing is left to wait for
+                    if capture_done.is_set():
+                        progress_bar.close()
+                        Logger.info(f"✅ Captured all {playlist_segments} fragments listed in the playlist")
+                        break
+                    video_state = None  # Player state, when it was probed during this wake
+                    probe_error = None
+
+                    # Periodically seek forward to force loading more fragments. Probes that come
+                    # sooner than jump_interval only keep the player going and read its state,
+                    # so a stall doesn't make the player skip ahead more often
+                    if now >= next_seek:
+                        since_last_seek = now - last_seek
+                        last_seek = now
+                        jump = now - last_jump >= jump_interval
+                        if jump:
+                            last_jump = now
                         try:
-                            video_state = await page.evaluate("""
-                                (() => {
-                                    const video = document.querySelector('video');
-                                    if (video) {
-                                        // If paused, play it
-                                        if (video.paused) {
-                                            video.play().catch(e => console.log('Play failed:', e));
-                                        }
-                                        
-                                        // Ensure playback rate is still at 4x
-                                        if (video.playbackRate < 4) {
-                                            video.playbackRate = 4.0;
-                                        }
-                                        
-                                        // Jump forward 60 seconds to force loading more fragments
-                                        // Only if duration is valid (not NaN)
-                                        if (isFinite(video.duration) && isFinite(video.currentTime)) {
-                                            // If we're near the end (last 15 seconds), pause to prevent autoplay to next class
-                                            if (video.currentTime >= video.duration - 15) {
-                                                video.pause();
-                                                console.log('⏸️ Video near end - paused to prevent next class');
-                                            } else {
-                                                const jumpTo = Math.min(video.currentTime + 60, video.duration - 15);
-                                                if (jumpTo > video.currentTime && jumpTo < video.duration) {
-                                                    video.currentTime = jumpTo;
-                                                }
-                                            }
-                                        }
-                                        
-                                        // Get DOM time display for better stuck detection
-                                        const currentTimeDisplay = document.querySelector('.vjs-current-time-display');
-                                        const durationDisplay = document.querySelector('.vjs-duration-display');
-                                        
-                                        return {
-                                            currentTime: isFinite(video.currentTime) ? video.currentTime : null,
-                                            duration: isFinite(video.duration) ? video.duration : null,
-                                            paused: video.paused,
-                                            rate: video.playbackRate,
-                                            domCurrentTime: currentTimeDisplay ? currentTimeDisplay.textContent.trim() : null,
-                                            domDuration: durationDisplay ? durationDisplay.textContent.trim() : null
-                                        };
-                                    }
-                                    return null;
-                                })()
-                            """)
+                            video_state = await page.evaluate("jump => window.__platziCtl.tick(jump)", jump)
                             
                             if video_state:
-                                current_time = video_state.get('currentTime', 0) or 0
-                                duration = video_state.get('duration', 0) or 0
-                                rate = video_state.get('rate', 1) or 1
-                                dom_current = video_state.get('domCurrentTime')
-                                dom_duration = video_state.get('domDuration')
+                                state = video_state.get
+                                if state('jumped'):
+                                    writer.seeked()
+                                current_time = state('currentTime', 0) or 0
+                                duration = state('duration', 0) or 0
+                                dom_current = state('domCurrentTime')
                                 
                                 # Only log every 60 seconds to avoid cluttering tqdm
-                                if seconds_since_seek == 0 and second % 60 == 0:
-                                    progress_bar.write(f"⏱️  Video: {current_time:.0f}s / {duration:.0f}s | Fragments: {current_count} | Size: {sum(f['size'] for f in captured_fragments) / 1024 / 1024:.1f} MB")
+                                if now - last_status >= 60:
+                                    last_status = now
+                                    progress_bar.write(f"⏱️  Video: {current_time:.0f}s / {duration:.0f}s | Fragments: {current_count} | Size: {total_bytes / 1024 / 1024:.1f} MB")
                                 
                                 # Track initial duration to detect class changes
                                 if initial_video_duration is None and duration > 0:
@@ -846,31 +1268,26 @@ class AsyncPlatzi:
                                 if dom_current and dom_current == last_dom_time:
                                     dom_stuck = True
                                 
-                                element_stuck = abs(current_time - last_video_position) < 2  # Less than 2 seconds movement
+                                # The page records when playback last advanced; fall back to comparing
+                                # positions if it didn't report it
+                                stalled_for = state('stalledFor')
+                                if stalled_for is not None:
+                                    element_stuck = stalled_for >= since_last_seek
+                                else:
+                                    element_stuck = abs(current_time - last_video_position) < 2  # Less than 2 seconds movement
                                 
                                 if element_stuck or dom_stuck:
-                                    video_stuck_seconds += seek_interval
+                                    video_stuck_seconds += since_last_seek
                                     
                                     # Special case: If stuck at very beginning (0-5s), reload faster
                                     if current_time <= 5 and video_stuck_seconds >= 30 and reload_count < max_reloads:
                                         progress_bar.write(f"🔄 Video stuck at start ({current_time:.0f}s) - reloading immediately")
                                         try:
-                                            await page.reload(timeout=30000)
-                                            await asyncio.sleep(5)
+                                            await self._reload_player(page)
                                             
                                             # Start fresh from beginning
-                                            await page.evaluate("""
-                                                (() => {
-                                                    const video = document.querySelector('video');
-                                                    if (video) {
-                                                        video.muted = true;
-                                                        video.playbackRate = 4.0;
-                                                        video.currentTime = 0;
-                                                        video.play().catch(e => console.log('Play failed:', e));
-                                                        console.log('🎬 Video restarted from beginning at 4x speed');
-                                                    }
-                                                })()
-                                            """)
+                                            await page.evaluate("window.__platziCtl.resume(0)")
+                                            writer.seeked()
                                             
                                             reload_count += 1
                                             video_stuck_seconds = 0
@@ -885,16 +1302,8 @@ class AsyncPlatzi:
                                         try:
                                             if duration > 0 and current_time < duration - 60:
                                                 target = min(current_time + 120, duration - 20)  # Jump 2 minutes or near end
-                                                await page.evaluate(f"""
-                                                    (() => {{
-                                                        const video = document.querySelector('video');
-                                                        if (video) {{
-                                                            video.currentTime = {target};
-                                                            video.play().catch(e => console.log('Play failed:', e));
-                                                            console.log('⚡ Forced aggressive seek to {target}s');
-                                                        }}
-                                                    }})()
-                                                """)
+                                                await page.evaluate("target => window.__platziCtl.jump(target)", target)
+                                                writer.seeked()
                                                 progress_bar.write(f"⚡ Forced jump to {target:.0f}s to unstuck video")
                                                 video_stuck_seconds = 0
                                         except Exception as e:
@@ -912,23 +1321,11 @@ class AsyncPlatzi:
                                             progress_bar.write(f"📍 Will resume from ~{resume_position:.0f}s to avoid duplicates")
                                             
                                             # Reload the page to restart video
-                                            await page.reload(timeout=30000)
-                                            await asyncio.sleep(5)  # Wait for page to stabilize
+                                            await self._reload_player(page)
                                             
                                             # Resume video from last position at 4x speed
-                                            await page.evaluate(f"""
-                                                (() => {{
-                                                    const video = document.querySelector('video');
-                                                    if (video) {{
-                                                        video.muted = true;
-                                                        video.playbackRate = 4.0;
-                                                        // Seek to last captured position to avoid duplicates
-                                                        video.currentTime = {resume_position};
-                                                        video.play().catch(e => console.log('Play failed:', e));
-                                                        console.log('🎬 Video resumed from {resume_position:.0f}s at 4x speed after reload');
-                                                    }}
-                                                }})()
-                                            """)
+                                            await page.evaluate("position => window.__platziCtl.resume(position)", resume_position)
+                                            writer.seeked()
                                             
                                             reload_count += 1
                                             video_stuck_seconds = 0
@@ -963,7 +1360,7 @@ class AsyncPlatzi:
                                         break
                                 
                                 # Detect if current video ended (near the end)
-                                if duration > 0 and current_time >= duration - 10:
+                                if state('ended') or (duration > 0 and current_time >= duration - 10):
                                     progress_bar.close()
                                     Logger.info(f"✅ Video reached end ({current_time:.0f}s / {duration:.0f}s)")
                                     Logger.info(f"🛑 Stopping capture to avoid next class")
@@ -972,6 +1369,7 @@ class AsyncPlatzi:
                                 
                         except Exception as seek_error:
                             Logger.debug(f"Could not seek video: {seek_error}")
+                            probe_error = seek_error
                     
                     # Break outer loop if video ended
                     if video_ended:
@@ -983,80 +1381,61 @@ class AsyncPlatzi:
                         # IMPORTANT: Also verify video is near the end (not just fragment count)
                         if expected_fragments and current_count >= expected_fragments * 0.95:
                             # Got 95% of expected fragments, but verify video is also near end
-                            # Get current video state to confirm
-                            try:
-                                final_check = await page.evaluate("""
-                                    (() => {
-                                        const video = document.querySelector('video');
-                                        if (video) {
-                                            return {
-                                                currentTime: isFinite(video.currentTime) ? video.currentTime : 0,
-                                                duration: isFinite(video.duration) ? video.duration : 0
-                                            };
-                                        }
-                                        return null;
-                                    })()
-                                """)
-                                
-                                if final_check:
-                                    video_current = final_check.get('currentTime', 0) or 0
-                                    video_duration = final_check.get('duration', 0) or 0
-                                    
-                                    # Only stop if video is at least 97% complete (within last 15 seconds)
-                                    if video_duration > 0:
-                                        video_progress = video_current / video_duration
-                                        seconds_remaining = video_duration - video_current
-                                        
-                                        # Stop if very close to end (97%+ or ≤15 seconds remaining)
-                                        if video_progress >= 1 or seconds_remaining <= 15:
-                                            progress_bar.close()
-                                            Logger.info(f"✅ Captured expected fragments ({current_count}/{expected_fragments}) and video at {video_progress*100:.0f}% ({seconds_remaining:.0f}s remaining)")
-                                            break
-                                        else:
-                                            # Only log every 5 checks to avoid spam
-                                            if second % 5 == 0:
-                                                progress_bar.write(f"⏳ Fragments: {current_count}/{expected_fragments} | Video: {video_progress*100:.0f}% ({seconds_remaining:.0f}s remaining)")
-                                    else:
-                                        # No duration info, trust fragment count
-                                        progress_bar.close()
-                                        Logger.info(f"✅ Captured expected number of fragments ({current_count}/{expected_fragments})")
-                                        break
-                            except Exception as e:
-                                Logger.debug(f"Error checking final video state: {e}")
+                            # Decide on the wakes where the seek probe just read the player, rather
+                            # than asking the page again on every fragment arrival
+                            if probe_error is not None:
+                                Logger.debug(f"Error checking final video state: {probe_error}")
                                 # If can't check, trust the fragment count
                                 progress_bar.close()
                                 Logger.info(f"✅ Captured expected number of fragments ({current_count}/{expected_fragments})")
                                 break
+
+                            final_check = video_state
+                            if final_check:
+                                video_current = final_check.get('currentTime', 0) or 0
+                                video_duration = final_check.get('duration', 0) or 0
+
+                                # Only stop if video is at least 97% complete (within last 15 seconds)
+                                if video_duration > 0:
+                                    video_progress = video_current / video_duration
+                                    seconds_remaining = video_duration - video_current
+
+                                    # Stop if very close to end (97%+ or ≤15 seconds remaining)
+                                    if video_progress >= 1 or seconds_remaining <= 15:
+                                        progress_bar.close()
+                                        Logger.info(f"✅ Captured expected fragments ({current_count}/{expected_fragments}) and video at {video_progress * 100:.0f}% ({seconds_remaining:.0f}s remaining)")
+                                        break
+                                    else:
+                                        # Only log every 5 seconds to avoid spam
+                                        if now - last_wait_note >= 5:
+                                            last_wait_note = now
+                                            progress_bar.write(f"⏳ Fragments: {current_count}/{expected_fragments} | Video: {video_progress * 100:.0f}% ({seconds_remaining:.0f}s remaining)")
+                                else:
+                                    # No duration info, trust fragment count
+                                    progress_bar.close()
+                                    Logger.info(f"✅ Captured expected number of fragments ({current_count}/{expected_fragments})")
+                                    break
                                 
                         elif no_progress_seconds >= 60:
                             # No new fragments for 60 seconds
                             # But check if we have enough - don't stop if clearly incomplete
                             if expected_fragments and current_count < expected_fragments * 0.7:
                                 # We have less than 70% of expected fragments
-                                progress_bar.write(f"⚠️  Only {current_count}/{expected_fragments} fragments ({current_count/expected_fragments*100:.0f}%) - video may be incomplete")
+                                progress_bar.write(f"⚠️  Only {current_count}/{expected_fragments} fragments ({current_count * percent_per_fragment:.0f}%) - video may be incomplete")
                                 progress_bar.write(f"⏳ Waiting longer for remaining fragments...")
-                                no_progress_seconds = 0  # Reset and keep waiting
+                                last_progress = now  # Reset and keep waiting
                                 
                                 # Try to unstick the video by seeking
                                 try:
-                                    await page.evaluate("""
-                                        (() => {
-                                            const video = document.querySelector('video');
-                                            if (video && video.duration > 0) {
-                                                const jumpTo = Math.min(video.currentTime + 60, video.duration - 10);
-                                                video.currentTime = jumpTo;
-                                                video.play().catch(e => console.log('Play error:', e));
-                                                console.log('Seeking forward to load more fragments...');
-                                            }
-                                        })()
-                                    """)
+                                    await page.evaluate("window.__platziCtl.nudge()")
+                                    writer.seeked()
                                 except:
                                     pass
                             else:
                                 # We have most fragments (70%+) or no expected count
                                 progress_bar.close()
                                 if expected_fragments:
-                                    Logger.info(f"✅ No new fragments for 60s with {current_count}/{expected_fragments} captured ({current_count/expected_fragments*100:.0f}%)")
+                                    Logger.info(f"✅ No new fragments for 60s with {current_count}/{expected_fragments} captured ({current_count * percent_per_fragment:.0f}%)")
                                 else:
                                     Logger.info(f"✅ No new fragments for 60s, assuming download complete")
                                 break
@@ -1067,49 +1446,49 @@ class AsyncPlatzi:
                         Logger.warning(f"⚠️  Reached fragment limit (3000), stopping capture")
                         break
             
+            # Stop taking new responses and let the fragments already in flight land on disk
+            page.remove_listener('response', handle_response)
+            listening = False
+            if capture_tasks:
+                await asyncio.gather(*capture_tasks, return_exceptions=True)
+            writer.close()
+            await writer_task
+
             await page.close()
             
             # Check if we captured anything
-            if len(captured_fragments) == 0:
+            if fragments_written == 0:
                 Logger.error("❌ No video fragments were captured")
                 return False
             
-            Logger.info(f"✅ Captured {len(captured_fragments)} video fragments")
-            total_size = sum(f['size'] for f in captured_fragments) / 1024 / 1024
+            Logger.info(f"✅ Captured {fragments_written} video fragments")
+            total_size = total_bytes / 1024 / 1024
             Logger.info(f"📦 Total size: {total_size:.1f} MB")
             
             # Check if capture appears complete
             if expected_fragments:
-                completion_rate = len(captured_fragments) / expected_fragments
+                completion_rate = fragments_written / expected_fragments
                 if completion_rate < 0.7:
-                    Logger.warning(f"⚠️  Video may be INCOMPLETE: {len(captured_fragments)}/{expected_fragments} fragments ({completion_rate*100:.0f}%)")
-                    Logger.warning(f"⚠️  Expected ~{expected_fragments} fragments but only captured {len(captured_fragments)}")
+                    Logger.warning(f"⚠️  Video may be INCOMPLETE: {fragments_written}/{expected_fragments} fragments ({completion_rate * 100:.0f}%)")
+                    Logger.warning(f"⚠️  Expected ~{expected_fragments} fragments but only captured {fragments_written}")
                     Logger.warning(f"💡 The video might have gotten stuck. You may need to re-download this unit.")
                 elif completion_rate < 0.9:
-                    Logger.warning(f"⚠️  Video might be slightly incomplete: {len(captured_fragments)}/{expected_fragments} fragments ({completion_rate*100:.0f}%)")
+                    Logger.warning(f"⚠️  Video might be slightly incomplete: {fragments_written}/{expected_fragments} fragments ({completion_rate * 100:.0f}%)")
                 else:
-                    Logger.info(f"✅ Capture appears complete: {len(captured_fragments)}/{expected_fragments} fragments ({completion_rate*100:.0f}%)")
+                    Logger.info(f"✅ Capture appears complete: {fragments_written}/{expected_fragments} fragments ({completion_rate * 100:.0f}%)")
             
             # Merge fragments with ffmpeg
             Logger.info("🔧 Merging fragments with ffmpeg...")
             
-            # Create concat list file
-            concat_file = temp_dir / "concat.txt"
-            async with aiofiles.open(concat_file, 'w') as f:
-                for fragment in sorted(captured_fragments, key=lambda x: x['index']):
-                    # Use relative paths for better compatibility
-                    await f.write(f"file '{fragment['path'].name}'\n")
-            
             # Ensure output directory exists
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Run ffmpeg to merge
+            # Run ffmpeg to remux the captured stream; the writer already appended the
+            # fragments in sequence order, so no concat list is needed
             # Use only filename since we're setting cwd to temp_dir
             ffmpeg_cmd = [
                 'ffmpeg',
-                '-f', 'concat',
-                '-safe', '0',
-                '-i', 'concat.txt',  # Just filename, not full path
+                '-i', stream_path.name,  # Just filename, not full path
                 '-c', 'copy',  # Copy without re-encoding for speed
                 '-y',  # Overwrite output
                 str(output_path.resolve())  # Use absolute path for output
@@ -1152,6 +1531,26 @@ class AsyncPlatzi:
             return False
             
         finally:
+            # If capture was abandoned early, stop taking responses, cancel the fragment
+            # fetches still in flight and close the page, so nothing writes into the
+            # temporary directory while it is being removed
+            if listening:
+                page.remove_listener('response', handle_response)
+            for task in capture_tasks:
+                task.cancel()
+            if capture_tasks:
+                await asyncio.gather(*capture_tasks, return_exceptions=True)
+            if page is not None and not page.is_closed():
+                try:
+                    await page.close()
+                except Exception as close_error:
+                    Logger.debug(f"Could not close interception page: {close_error}")
+
+            # Stop the fragment writer
+            if writer_task is not None and not writer_task.done():
+                writer_task.cancel()
+                await asyncio.gather(writer_task, return_exceptions=True)
+
             # Cleanup temporary directory
             try:
                 if temp_dir.exists():
@@ -1333,6 +1732,19 @@ class AsyncPlatzi:
             Logger.info(f"🔄 Re-processing course (has pending units): {url}")
         
         page = await self.page
+        unit_tasks = {}  # (chapter index, unit index) -> task collecting that unit's data
+
+        def collect_unit(chapter_idx, chapter_units, position):
+            """Start collecting the data of unit ``position`` of a chapter, unless it is already underway or skipped."""
+            key = (chapter_idx, position)
+            if key in unit_tasks or position > len(chapter_units):
+                return
+            unit_url = chapter_units[position - 1].url
+            if self.progress.should_skip_unit(course_id, urlparse(unit_url).path):
+                return
+            unit_tasks[key] = asyncio.create_task(
+                get_unit(self.context, unit_url, browser_type=self.browser_type)
+            )
         
         try:
             # Use retry logic for more reliable navigation
@@ -1439,7 +1851,8 @@ class AsyncPlatzi:
                     self.progress.start_unit(course_id, unit_id, draft_unit.title)
                     
                     try:
-                        unit = await get_unit(self.context, draft_unit.url, browser_type=self.browser_type)
+                        collect_unit(idx, draft_chapter.units, jdx)
+                        unit = await unit_tasks.pop((idx, jdx))
                     except Exception as e:
                         error_msg = f"Error collecting unit data: {str(e)}"
                         Logger.error(f"{error_msg} for '{draft_unit.title}'", exception=e)
@@ -1448,6 +1861,11 @@ class AsyncPlatzi:
                         self.progress.fail_unit(course_id, unit_id, error_msg)
                         continue
                     
+                    # Only the next unit's page loads in the background while this one
+                    # downloads, so at most one extra page competes with the capture and
+                    # its signed video URLs are still fresh when they are used
+                    collect_unit(idx, draft_chapter.units, jdx + 1)
+
                     try:
                         file_name = f"{jdx}. {clean_string(unit.title, max_length=35)}"
 
@@ -1902,6 +2320,11 @@ class AsyncPlatzi:
             self.progress.fail_course(course_id, error_msg)
             raise
         finally:
+            # Drop unit collections that were started ahead but never used
+            for task in unit_tasks.values():
+                task.cancel()
+            if unit_tasks:
+                await asyncio.gather(*unit_tasks.values(), return_exceptions=True)
             await page.close()
     @try_except_request
     async def save_page(
@@ -2425,12 +2848,12 @@ class AsyncPlatzi:
             await page.close()
 
     @try_except_request
-    async def get_json(self, url: str) -> dict:
+    async def get_text(self, url: str) -> str:
         page = await self.page
         await self._goto_with_retry(page, url, max_retries=3)
         content = await page.locator("pre").first.text_content()
         await page.close()
-        return json.loads(content or "{}")
+        return content
 
     async def _save_state(self):
         cookies = await self.context.cookies()
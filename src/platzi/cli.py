@@ -609,18 +609,57 @@ def clean_tracking(
 
 async def _clean_tracking(checkpoint: str = "download_progress.json", dry_run: bool = False):
     """Clean tracking implementation."""
-    import json
+    import os
     import shutil
     from datetime import datetime
     from pathlib import Path
+
+    from platzi.progress_tracker import load_checkpoint, write_checkpoint
     from platzi.utils import clean_string
+
+    courses_base = Path("Courses")
+    # Remove common punctuation that gets stripped in filenames
+    strip_punct = str.maketrans('', '', ':?¿')
+    # Directory listings are built once per run instead of once per course/unit
+    learning_path_dirs: list = []
+    course_files_index: dict = {}
+
+    def index_learning_paths() -> None:
+        """List every course directory inside the learning path folders."""
+        if not courses_base.exists():
+            return
+        # DirEntry caches the file type from readdir, so is_dir() needs no extra stat
+        with os.scandir(courses_base) as learning_paths:
+            for learning_path in learning_paths:
+                if not learning_path.is_dir():
+                    continue
+                with os.scandir(learning_path.path) as course_dirs:
+                    for course_dir in course_dirs:
+                        if course_dir.is_dir():
+                            learning_path_dirs.append(Path(course_dir.path))
+
+    def index_course_files(course_dir: Path) -> list:
+        """List (path, title, normalized title) for every unit file of a course."""
+        entries = []
+        with os.scandir(course_dir) as chapter_dirs:
+            chapter_paths = [entry.path for entry in chapter_dirs if entry.is_dir()]
+
+        for chapter_path in chapter_paths:
+            with os.scandir(chapter_path) as chapter_files:
+                for entry in chapter_files:
+                    if not entry.is_file():
+                        continue
+
+                    # Format: "N. Title.ext" so we keep the title after the first ". "
+                    file_path = Path(entry.path)
+                    filename = file_path.stem  # filename without extension
+                    if '. ' in filename:
+                        title_part = filename.split('. ', 1)[1].lower()
+                        entries.append((file_path, title_part, title_part.translate(strip_punct).strip()))
+        return entries
     
     def find_course_directory(course_title: str) -> Path:
         """Try to find the course directory."""
-        courses_base = Path("Courses")
-        if not courses_base.exists():
-            return None
-        
         clean_title = clean_string(course_title, max_length=80)
         
         # Try direct path
@@ -629,11 +668,9 @@ async def _clean_tracking(checkpoint: str = "download_progress.json", dry_run: b
             return direct_path
         
         # Try to find in learning paths
-        for learning_path in courses_base.iterdir():
-            if learning_path.is_dir():
-                for course_dir in learning_path.iterdir():
-                    if course_dir.is_dir() and clean_title in course_dir.name:
-                        return course_dir
+        for course_dir in learning_path_dirs:
+            if clean_title in course_dir.name:
+                return course_dir
         
         return None
     
@@ -644,41 +681,24 @@ async def _clean_tracking(checkpoint: str = "download_progress.json", dry_run: b
         
         # Clean and normalize the title for comparison
         clean_title = clean_string(unit_title, max_length=50).lower()
-        # Remove common punctuation that gets stripped in filenames
-        clean_title_normalized = clean_title.replace(':', '').replace('?', '').replace('¿', '').strip()
+        clean_title_normalized = clean_title.translate(strip_punct).strip()
+
+        if course_dir not in course_files_index:
+            course_files_index[course_dir] = index_course_files(course_dir)
         
         possible_files = set()  # Use set to avoid duplicates
         
-        # Search in all chapter directories
-        for chapter_dir in course_dir.iterdir():
-            if not chapter_dir.is_dir():
-                continue
-                
-            # Search by title pattern (more flexible than by index)
-            for file_path in chapter_dir.iterdir():
-                if not file_path.is_file():
-                    continue
-                    
-                # Check if filename contains the unit title
-                # Format: "N. Title.ext" so we check after the first "."
-                filename = file_path.stem  # filename without extension
-                
-                # Extract title part after "N. " if it exists
-                if '. ' in filename:
-                    parts = filename.split('. ', 1)
-                    if len(parts) == 2:
-                        title_part = parts[1].lower()
-                        title_part_normalized = title_part.replace(':', '').replace('?', '').replace('¿', '').strip()
-                        
-                        # Match using both original and normalized titles
-                        # This handles cases like "Quiz: Title" vs "Quiz Title"
-                        if (title_part.startswith(clean_title) or 
-                            clean_title in title_part or 
-                            title_part_normalized.startswith(clean_title_normalized) or
-                            clean_title_normalized in title_part_normalized or
-                            (len(title_part) > 10 and title_part in clean_title) or
-                            (len(title_part_normalized) > 10 and title_part_normalized in clean_title_normalized)):
-                            possible_files.add(file_path)
+        # Search by title pattern (more flexible than by index)
+        for file_path, title_part, title_part_normalized in course_files_index[course_dir]:
+            # Match using both original and normalized titles
+            # This handles cases like "Quiz: Title" vs "Quiz Title"
+            if (title_part.startswith(clean_title) or
+                clean_title in title_part or
+                title_part_normalized.startswith(clean_title_normalized) or
+                clean_title_normalized in title_part_normalized or
+                (len(title_part) > 10 and title_part in clean_title) or
+                (len(title_part_normalized) > 10 and title_part_normalized in clean_title_normalized)):
+                possible_files.add(file_path)
         
         return list(possible_files)
     
@@ -697,8 +717,7 @@ async def _clean_tracking(checkpoint: str = "download_progress.json", dry_run: b
     
     # Load checkpoint
     print(f"[cyan]📂 Loading checkpoint: {checkpoint}[/cyan]")
-    with open(checkpoint_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_checkpoint(checkpoint_path)
     
     # Backup
     if not dry_run:
@@ -719,6 +738,7 @@ async def _clean_tracking(checkpoint: str = "download_progress.json", dry_run: b
     
     # Check courses
     print("\n[bold cyan]🔍 Checking courses...[/bold cyan]")
+    index_learning_paths()
     courses_to_remove = []
     
     for course_id, course_data in data.get("courses", {}).items():
@@ -779,8 +799,11 @@ async def _clean_tracking(checkpoint: str = "download_progress.json", dry_run: b
         
         # Remove units
         if units_to_remove and not dry_run:
-            for unit_id in units_to_remove:
-                del course_data["units"][unit_id]
+            # Rebuild the units dict once rather than deleting key by key
+            removed_units = set(units_to_remove)
+            course_data["units"] = {
+                uid: u for uid, u in course_data["units"].items() if uid not in removed_units
+            }
             
             remaining_completed = sum(1 for u in course_data["units"].values() if u.get("status") == "completed")
             if remaining_completed == 0:
@@ -791,8 +814,8 @@ async def _clean_tracking(checkpoint: str = "download_progress.json", dry_run: b
     
     # Remove courses
     if courses_to_remove and not dry_run:
-        for course_id in courses_to_remove:
-            del data["courses"][course_id]
+        removed_courses = set(courses_to_remove)
+        data["courses"] = {cid: c for cid, c in data["courses"].items() if cid not in removed_courses}
     elif courses_to_remove and dry_run:
         print(f"\n[yellow][DRY-RUN] Would remove {len(courses_to_remove)} courses[/yellow]")
     
@@ -808,8 +831,7 @@ async def _clean_tracking(checkpoint: str = "download_progress.json", dry_run: b
         data["last_cleaned"] = datetime.now().isoformat()
         data["last_updated"] = datetime.now().isoformat()
         
-        with open(checkpoint_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        write_checkpoint(checkpoint_path, data)
         
         print(f"\n[green]✅ Checkpoint updated: {checkpoint}[/green]")
     
@@ -5,6 +5,8 @@ import platformdirs
 APP_NAME = "Platzi"
 SESSION_DIR = Path(platformdirs.user_data_dir(APP_NAME))
 SESSION_FILE = SESSION_DIR / "state.json"  # Cookies are stored here
+PROFILE_FILE = SESSION_DIR / "profile.json"  # Last fetched user profile
+PROFILE_TTL = 60 * 60  # Seconds a cached profile is trusted before fetching it again
 
 LOGIN_URL = "https://platzi.com/login"
 LOGIN_DETAILS_URL = "https://api.platzi.com/api/v1/components/headerv2/user/"
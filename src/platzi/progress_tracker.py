@@ -3,6 +3,8 @@ Progress tracking system for Platzi downloader.
 Keeps track of completed/failed downloads and allows resuming from checkpoints.
 """
 import json
+import os
+from collections import namedtuple
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -20,6 +22,35 @@ class DownloadStatus(Enum):
     SKIPPED = "skipped"
 
 
+def load_checkpoint(path: Path) -> Dict:
+    """Parse a checkpoint file from its raw bytes."""
+    with open(path, 'rb') as f:
+        return json.loads(f.read())
+
+
+def dump_checkpoint(data: Dict) -> bytes:
+    """Serialize checkpoint data to indented UTF-8 JSON."""
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def write_checkpoint(path: Path, data: Dict):
+    """Atomically replace a checkpoint file with ``data``.
+
+    The document is written to a sibling ``.tmp`` file, synced once and then
+    swapped in with ``os.replace``, so readers never see a half-written file.
+    """
+    tmp_path = path.with_suffix('.json.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(dump_checkpoint(data))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+# One row of the "courses with pending units" report section
+PendingCourse = namedtuple("PendingCourse", "title pending failed completed total")
+
+
 class ProgressTracker:
     """Tracks download progress and allows resuming from checkpoints."""
     
@@ -54,22 +85,21 @@ class ProgressTracker:
         """Load existing progress from checkpoint file."""
         if self.checkpoint_file.exists():
             try:
-                with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
-                    loaded_data = json.load(f)
-                    # Merge loaded data, preserving structure for new fields
-                    for key in loaded_data:
-                        if key in self.data and isinstance(self.data[key], dict) and isinstance(loaded_data[key], dict):
-                            self.data[key].update(loaded_data[key])
-                        else:
-                            self.data[key] = loaded_data[key]
-                    
-                    # Ensure metadata exists (for backwards compatibility)
-                    if "_metadata" not in self.data:
-                        self.data["_metadata"] = {
-                            "version": "2.0",
-                            "last_validation": None,
-                        }
-                    
+                loaded_data = load_checkpoint(self.checkpoint_file)
+                # Merge loaded data, preserving structure for new fields
+                for key in loaded_data:
+                    if key in self.data and isinstance(self.data[key], dict) and isinstance(loaded_data[key], dict):
+                        self.data[key].update(loaded_data[key])
+                    else:
+                        self.data[key] = loaded_data[key]
+
+                # Ensure metadata exists (for backwards compatibility)
+                if "_metadata" not in self.data:
+                    self.data["_metadata"] = {
+                        "version": "2.0",
+                        "last_validation": None,
+                    }
+
                 Logger.info(f"📂 Checkpoint loaded from {self.checkpoint_file}")
                 self._log_progress_summary()
             except Exception as e:
@@ -79,8 +109,7 @@ class ProgressTracker:
         """Save current progress to checkpoint file."""
         try:
             self.data["last_updated"] = datetime.now().isoformat()
-            with open(self.checkpoint_file, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, indent=2, ensure_ascii=False)
+            write_checkpoint(self.checkpoint_file, self.data)
         except Exception as e:
             Logger.error(f"Could not save checkpoint: {e}")
     
@@ -363,37 +392,47 @@ class ProgressTracker:
                 )
             report_lines.append("")
         
-        # Failed and pending items
-        failed_units = self.get_failed_units()
+        # Failed and pending items, gathered in a single pass over courses and units
+        completed_value = DownloadStatus.COMPLETED.value
+        failed_value = DownloadStatus.FAILED.value
+        pending_values = (DownloadStatus.PENDING.value, DownloadStatus.IN_PROGRESS.value)
+        failed_units = []
+        courses_with_pending = []
+        add_failed = failed_units.append
+        add_pending = courses_with_pending.append
+        for course_data in self.data["courses"].values():
+            course_title = course_data["title"]
+            units = course_data.get("units", {})
+            completed = failed = pending = 0
+            for unit_data in units.values():
+                unit_status = unit_data["status"]
+                if unit_status == completed_value:
+                    completed += 1
+                elif unit_status == failed_value:
+                    failed += 1
+                    add_failed((course_title, unit_data["title"], unit_data.get("error", "Unknown error")))
+                elif unit_status in pending_values:
+                    pending += 1
+            if pending > 0:
+                add_pending(PendingCourse(course_title, pending, failed, completed, len(units)))
+
         if failed_units:
             report_lines.append("❌ FAILED UNITS:")
-            for unit in failed_units[:10]:  # Show first 10
-                report_lines.append(f"  - {unit['course_title']} / {unit['unit_title']}")
-                report_lines.append(f"    Error: {unit['error']}")
+            for course_title, unit_title, error in failed_units[:10]:  # Show first 10
+                report_lines.append(f"  - {course_title} / {unit_title}")
+                report_lines.append(f"    Error: {error}")
             if len(failed_units) > 10:
                 report_lines.append(f"  ... and {len(failed_units) - 10} more failed units")
             report_lines.append("")
         
         # Courses with pending work
-        courses_with_pending = []
-        for course_id, course_data in self.data["courses"].items():
-            progress = self.get_course_progress(course_id)
-            if progress["pending_units"] > 0:
-                courses_with_pending.append({
-                    "title": course_data["title"],
-                    "pending": progress["pending_units"],
-                    "failed": progress["failed_units"],
-                    "completed": progress["completed_units"],
-                    "total": progress["total_units"]
-                })
-        
         if courses_with_pending:
             report_lines.append("⏳ COURSES WITH PENDING UNITS:")
             for course in courses_with_pending[:10]:
-                status = f"{course['completed']}/{course['total']} completed"
-                if course['failed'] > 0:
-                    status += f", {course['failed']} failed"
-                report_lines.append(f"  - {course['title']}: {status}")
+                status = f"{course.completed}/{course.total} completed"
+                if course.failed > 0:
+                    status += f", {course.failed} failed"
+                report_lines.append(f"  - {course.title}: {status}")
             report_lines.append("")
         
         report_lines.append("=" * 100)
@@ -505,12 +544,13 @@ class ProgressTracker:
     def get_failed_units(self, course_id: str = None) -> List[Dict]:
         """Get list of all failed units, optionally filtered by course."""
         failed = []
+        failed_status = DownloadStatus.FAILED.value  # resolve the enum value once, not per unit
         for cid, course_data in self.data["courses"].items():
             if course_id and cid != course_id:
                 continue
             
             for unit_id, unit_data in course_data.get("units", {}).items():
-                if unit_data["status"] == DownloadStatus.FAILED.value:
+                if unit_data["status"] == failed_status:
                     failed.append({
                         "course_id": cid,
                         "course_title": course_data["title"],
@@ -524,13 +564,15 @@ class ProgressTracker:
     def retry_failed_units(self, course_id: str = None):
         """Mark failed units as pending for retry."""
         retried_count = 0
+        failed_status = DownloadStatus.FAILED.value
+        pending_status = DownloadStatus.PENDING.value
         for cid, course_data in self.data["courses"].items():
             if course_id and cid != course_id:
                 continue
             
-            for unit_id, unit_data in course_data.get("units", {}).items():
-                if unit_data["status"] == DownloadStatus.FAILED.value:
-                    unit_data["status"] = DownloadStatus.PENDING.value
+            for unit_data in course_data.get("units", {}).values():
+                if unit_data["status"] == failed_status:
+                    unit_data["status"] = pending_status
                     unit_data["error"] = None
                     retried_count += 1
         
@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import re
 from pathlib import Path
 
@@ -74,6 +75,7 @@ def get_course_slug(url: str) -> str:
     return match.group(1)
 
 
+@functools.lru_cache(maxsize=4096)
 def clean_string(text: str, max_length: int = 100) -> str:
     """
     Remove special characters from a string and strip it.
@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+from platzi.async_api import FragmentWriter, _fragment_sequence
+
+
+class FakeStream:
+    def __init__(self):
+        self.written = []
+
+    async def writelines(self, lines):
+        self.written.extend(lines)
+
+
+def write_all(fragments, *, start=None, reorder_wait=60):
+    """Queue (sequence, body) pairs on a writer, close it and return what reached the stream."""
+
+    async def main():
+        stream = FakeStream()
+        writer = FragmentWriter(lambda ready: None, reorder_wait=reorder_wait)
+        if start is not None:
+            writer.expect(start)
+        for sequence, body in fragments:
+            writer.put(sequence, body)
+        writer.close()
+        await writer.run(stream)
+        return stream.written
+
+    return asyncio.run(main())
+
+
+def test_fragment_writer_restores_sequence_order():
+    fragments = [(3, b"c"), (1, b"a"), (4, b"d"), (2, b"b")]
+    assert write_all(fragments, start=1) == [b"a", b"b", b"c", b"d"]
+
+
+def test_fragment_writer_starts_at_the_expected_sequence():
+    # Without the seed, 6 would be taken as the start and 5 treated as late
+    fragments = [(6, b"f"), (5, b"e"), (7, b"g")]
+    assert write_all(fragments, start=5) == [b"e", b"f", b"g"]
+
+
+def test_fragment_writer_skips_unfilled_gaps_when_closed():
+    fragments = [(1, b"a"), (4, b"d"), (3, b"c")]
+    assert write_all(fragments, start=1) == [b"a", b"c", b"d"]
+
+
+def test_fragment_writer_appends_late_and_unnumbered_fragments_in_arrival_order():
+    fragments = [(5, b"e"), (6, b"f"), (None, b"x"), (2, b"b")]
+    assert write_all(fragments, start=5) == [b"e", b"f", b"x", b"b"]
+
+
+def test_fragment_writer_gives_up_on_a_gap_after_the_reorder_wait():
+    async def main():
+        stream = FakeStream()
+        writer = FragmentWriter(lambda ready: None, reorder_wait=0.05)
+        writer.expect(1)
+        task = asyncio.create_task(writer.run(stream))
+        writer.put(1, b"a")
+        writer.put(3, b"c")
+        await asyncio.sleep(0.2)
+        written = list(stream.written)
+        writer.close()
+        await task
+        return written
+
+    assert asyncio.run(main()) == [b"a", b"c"]
+
+
+def test_fragment_writer_skips_a_seek_gap_without_waiting():
+    async def main():
+        stream = FakeStream()
+        written_runs = []
+        writer = FragmentWriter(written_runs.append, reorder_wait=60)
+        writer.expect(1)
+        task = asyncio.create_task(writer.run(stream))
+        writer.put(1, b"a")
+        await asyncio.sleep(0.01)
+        writer.seeked()
+        writer.put(8, b"h")
+        writer.put(9, b"i")
+        await asyncio.sleep(0.01)
+        written = list(stream.written)
+        writer.close()
+        await task
+        return written, written_runs
+
+    written, written_runs = asyncio.run(main())
+    assert written == [b"a", b"h", b"i"]
+    assert written_runs == [[(1, b"a")], [(8, b"h"), (9, b"i")]]
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        ("/video/media_123.ts", 123),
+        ("/video/seg-45-v1-a1.ts", 45),
+        ("/video/frag_7.ts", 7),
+        ("/hls/chunk_720p/chunk_3.ts", 3),
+        ("/hls/media_1080/index.ts", None),
+        ("/hls/chunk_720p_3.ts", None),
+        ("/video/intro.ts", None),
+    ],
+)
+def test_fragment_sequence(path, expected):
+    assert _fragment_sequence(path) == expected
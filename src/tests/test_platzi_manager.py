@@ -0,0 +1,122 @@
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+# platzi_manager.py is a standalone script at the repository root
+_spec = importlib.util.spec_from_file_location(
+    "platzi_manager", Path(__file__).resolve().parents[2] / "platzi_manager.py"
+)
+platzi_manager = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(platzi_manager)
+
+CHECKPOINT = {
+    "started_at": "2025-01-01T10:00:00",
+    "learning_paths": {},
+    "courses": {
+        "/cursos/python/": {
+            "title": "Curso de Python",
+            "status": "completed",
+            "units": {
+                "/clases/1/": {"title": "Intro", "status": "completed"},
+                "/clases/2/": {"title": "Variables", "status": "completed"},
+            },
+        },
+        "/cursos/git/": {
+            "title": "Curso de Git",
+            "status": "in_progress",
+            "units": {
+                "/clases/3/": {"title": "Commits", "status": "completed"},
+                "/clases/4/": {
+                    "title": "Ramas",
+                    "status": "failed",
+                    "error": "timeout",
+                },
+                "/clases/5/": {"title": "Merge", "status": "pending"},
+            },
+        },
+        "/cursos/sql/": {
+            "title": "Curso de SQL",
+            "status": "failed",
+            "units": {
+                "/clases/6/": {"title": "Select", "status": "failed", "error": "403"},
+                "/clases/7/": {"title": "Joins", "status": "in_progress"},
+            },
+        },
+    },
+    "errors": [],
+}
+
+
+@pytest.fixture
+def checkpoint_path(tmp_path):
+    path = tmp_path / "download_progress.json"
+    path.write_text(json.dumps(CHECKPOINT), encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_checkpoint_round_trip(tmp_path, compact):
+    path = tmp_path / "download_progress.json"
+    path.write_bytes(platzi_manager._dumps(CHECKPOINT, compact=compact))
+
+    assert platzi_manager._read_checkpoint(path) == CHECKPOINT
+
+
+def test_empty_checkpoint_is_not_loaded(tmp_path):
+    path = tmp_path / "download_progress.json"
+    path.touch()
+
+    with pytest.raises(json.JSONDecodeError):
+        platzi_manager._read_checkpoint(path)
+    assert platzi_manager.ProgressManager(str(path)).data is None
+
+
+def test_get_statistics(checkpoint_path):
+    manager = platzi_manager.ProgressManager(str(checkpoint_path))
+
+    assert manager.get_statistics() == {
+        "total_courses": 3,
+        "completed_courses": 1,
+        "failed_courses": 1,
+        "in_progress_courses": 1,
+        "total_units": 7,
+        "completed_units": 3,
+        "failed_units": 2,
+        "in_progress_units": 1,
+        "pending_units": 1,
+    }
+
+
+def test_retry_failed_dry_run_changes_nothing(checkpoint_path):
+    manager = platzi_manager.ProgressManager(str(checkpoint_path))
+
+    assert manager.retry_failed(dry_run=True) == 2
+    assert manager.get_statistics()["failed_units"] == 2
+    assert json.loads(checkpoint_path.read_text(encoding="utf-8")) == CHECKPOINT
+
+
+def test_retry_failed(checkpoint_path):
+    manager = platzi_manager.ProgressManager(str(checkpoint_path))
+
+    assert manager.retry_failed() == 2
+
+    stats = manager.get_statistics()
+    assert stats["failed_units"] == 0
+    assert stats["pending_units"] == 3
+    saved = platzi_manager.ProgressManager(str(checkpoint_path)).data
+    assert saved["courses"]["/cursos/git/"]["units"]["/clases/4/"] == {
+        "title": "Ramas",
+        "status": "pending",
+        "error": None,
+    }
+    assert checkpoint_path.with_suffix(".json.backup").exists()
+
+
+def test_retry_failed_for_one_course(checkpoint_path):
+    manager = platzi_manager.ProgressManager(str(checkpoint_path))
+
+    assert manager.retry_failed(course_id="/cursos/sql/") == 1
+    units = manager.data["courses"]["/cursos/git/"]["units"]
+    assert units["/clases/4/"]["status"] == "failed"
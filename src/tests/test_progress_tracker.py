@@ -0,0 +1,43 @@
+import json
+
+import pytest
+
+from platzi.progress_tracker import load_checkpoint, write_checkpoint
+
+
+def test_checkpoint_round_trip(tmp_path):
+    path = tmp_path / "download_progress.json"
+    data = {
+        "started_at": "2025-01-01T10:00:00",
+        "courses": {
+            "/cursos/python/": {
+                "title": "Curso de Python: Año 1 ★",
+                "status": "completed",
+                "units": {
+                    "/clases/1/": {"title": "Introducción", "status": "completed"}
+                },
+            }
+        },
+        "errors": [],
+    }
+
+    write_checkpoint(path, data)
+
+    assert load_checkpoint(path) == data
+    assert list(tmp_path.iterdir()) == [path]  # the temporary file was swapped in
+
+
+def test_checkpoint_is_replaced(tmp_path):
+    path = tmp_path / "download_progress.json"
+    write_checkpoint(path, {"courses": {"a": {}}})
+    write_checkpoint(path, {"courses": {}})
+
+    assert load_checkpoint(path) == {"courses": {}}
+
+
+def test_empty_checkpoint_raises(tmp_path):
+    path = tmp_path / "download_progress.json"
+    path.touch()
+
+    with pytest.raises(json.JSONDecodeError):
+        load_checkpoint(path)